@@ -6,7 +6,8 @@ from typing import Optional
 
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
 
-from ..data.loader import ChargingDataLoader
+from ..data.loader import ChargingDataLoader, remove_orphan_sidecars, remove_parquet_sidecars
+from ..data.repository import STATIONS_CACHE_FILE, invalidate_loader_file_caches
 from ..data.validator import ChargingDataValidator
 from ..services.station_service import StationService
 
@@ -302,6 +303,8 @@ async def upload_csv_file(file: UploadFile = File(...), file_type: str = Form("c
         safe_name = Path(file.filename).name  # 디렉토리 제거
         file_path = (upload_dir / safe_name).resolve()
 
+        # 같은 이름의 CSV를 교체하는 경우 이전 데이터의 Parquet 사이드카 삭제
+        remove_parquet_sidecars(file_path)
         with open(file_path, "wb") as f:
             f.write(contents)
 
@@ -319,6 +322,9 @@ async def upload_csv_file(file: UploadFile = File(...), file_type: str = Form("c
         except Exception as e:
             logger.warning(f"Failed to write .active_csv: {e}")
 
+        # 공유 로더의 파일 목록/활성 파일 캐시 무효화 (FILE_CACHE_TTL 대기 없이 새 파일 반영)
+        invalidate_loader_file_caches()
+
         # ChargingDataValidator 활용
         validator = ChargingDataValidator()
 
@@ -918,13 +924,21 @@ async def clear_all_data():
         deleted_count = 0
         for csv_file in csv_files:
             csv_file.unlink()
+            remove_parquet_sidecars(csv_file)
             deleted_count += 1
+        # 이전에 CSV만 삭제되어 남아 있던 사이드카도 정리
+        remove_orphan_sidecars(data_dir)
+        # 삭제된 데이터로 만든 충전소 목록 캐시 삭제
+        (data_dir / STATIONS_CACHE_FILE).unlink(missing_ok=True)
 
         # 활성 마커 삭제
         marker = data_dir / ".active_csv"
         if marker.exists():
             marker.unlink(missing_ok=True)
 
+        # 공유 로더의 파일 목록/활성 파일 캐시 무효화
+        invalidate_loader_file_caches()
+
         # 캐시 클리어
         station_service = get_station_service()
         station_service.clear_cache()
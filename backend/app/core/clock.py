@@ -0,0 +1,20 @@
+"""
+Cached wall-clock helpers for hot response paths
+"""
+import time
+from datetime import datetime
+
+# Cached ISO timestamp for the current wall-clock second: (epoch second, iso string)
+_now_cache = (None, "")
+
+
+def iso_now() -> str:
+    """Return the current local time as ISO string, cached per second"""
+    global _now_cache
+    sec = int(time.time())
+    cached_sec, cached_iso = _now_cache
+    if sec != cached_sec:
+        # Any change of second (forward or backward clock steps) refreshes; one assignment keeps the pair consistent
+        cached_iso = datetime.fromtimestamp(sec).isoformat()
+        _now_cache = (sec, cached_iso)
+    return cached_iso
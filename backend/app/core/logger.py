@@ -1,6 +1,9 @@
 # 로깅 설정
 import logging
 import sys
+import threading
+import time
+import weakref
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from datetime import datetime
@@ -39,24 +42,97 @@ def setup_logger(name: str, log_file: str = None, level: str = "INFO") -> loggin
     return logger
 
 
+# 모든 PerformanceLogger가 공유하는 플러시 스레드 (약한 참조로 추적하여 인스턴스 수거를 막지 않음)
+_perf_loggers = weakref.WeakSet()
+_perf_flusher = None
+_perf_flusher_lock = threading.Lock()
+
+
+def _flush_perf_loggers():
+    for perf_logger in list(_perf_loggers):
+        perf_logger.flush()
+
+
+def _flush_buffer(logger: logging.Logger, buf: list, lock: threading.Lock):
+    # 인스턴스 수거 또는 인터프리터 종료 시 남은 레코드 기록 (weakref.finalize 콜백)
+    with lock:
+        pending = buf[:]
+        buf.clear()
+    if pending:
+        logger.info("\n".join(pending))
+
+
+def _perf_flush_loop(interval: float):
+    # 새 레코드가 없어도 interval마다 버퍼를 비움
+    while True:
+        time.sleep(interval)
+        _flush_perf_loggers()
+
+
+def _register_perf_logger(perf_logger: "PerformanceLogger"):
+    global _perf_flusher
+    _perf_loggers.add(perf_logger)
+    with _perf_flusher_lock:
+        if _perf_flusher is None:
+            _perf_flusher = threading.Thread(
+                target=_perf_flush_loop, args=(perf_logger.FLUSH_INTERVAL,), name="performance-log-flush", daemon=True
+            )
+            _perf_flusher.start()
+
+
+
 class PerformanceLogger:
     
 
+    # 예측 로그 버퍼링: 최대 레코드 수 / 최대 보류 시간(초)
+    BUFFER_SIZE = 256
+    FLUSH_INTERVAL = 0.2
+
     def __init__(self, logger_name: str = "performance"):
         self.logger = setup_logger(logger_name, "logs/performance.log")
+        self._buf = []
+        self._buf_lock = threading.Lock()
+        self._flush_at = time.monotonic() + self.FLUSH_INTERVAL
+        _register_perf_logger(self)
+        # 종료 시(atexit)와 수거 시 모두 남은 로그를 기록; self를 참조하지 않아 수거를 막지 않음
+        weakref.finalize(self, _flush_buffer, self.logger, self._buf, self._buf_lock)
 
     def log_prediction_performance(self, actual: float, predicted: float, station_id: str, timestamp: datetime):
         
         error = abs(actual - predicted)
         error_rate = error / actual if actual > 0 else 0
 
-        self.logger.info(
+        record = (
             f"Prediction - Station: {station_id}, "
             f"Actual: {actual:.2f}, Predicted: {predicted:.2f}, "
             f"Error: {error:.2f}, Error Rate: {error_rate:.3f}, "
             f"Timestamp: {timestamp}"
         )
 
+        with self._buf_lock:
+            self._buf.append(record)
+            if len(self._buf) < self.BUFFER_SIZE and time.monotonic() < self._flush_at:
+                return
+            pending = self._drain()
+
+        self.logger.info("\n".join(pending))
+
+    def flush(self):
+        # 버퍼에 남은 예측 로그를 한 번에 기록
+        with self._buf_lock:
+            pending = self._drain()
+
+        if pending:
+            self.logger.info("\n".join(pending))
+
+    def _drain(self) -> list:
+        # 호출자가 _buf_lock을 보유한 상태여야 함
+        # finalize 콜백이 같은 리스트를 참조하므로 교체하지 않고 비움
+        pending = self._buf[:]
+        self._buf.clear()
+        self._flush_at = time.monotonic() + self.FLUSH_INTERVAL
+        return pending
+
     def log_model_training(self, model_name: str, training_time: float, accuracy_metrics: dict):
         
         self.logger.info(
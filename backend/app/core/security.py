@@ -1,9 +1,10 @@
 """
 Security utilities and authentication middleware
 """
-import hashlib
 import secrets
+import hmac
 import re
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from pathlib import Path
@@ -12,14 +13,73 @@ from fastapi import HTTPException, Depends, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import logging
 
+from .clock import iso_now
+
 logger = logging.getLogger(__name__)
 
 # Simple API key store - In production, use proper secrets management
+# Precomputed: "pdp_<role>_" + sha256(b"power_demand_predictor_<role>").hexdigest()[:32]
 API_KEYS = {
-    "admin": "pdp_admin_" + hashlib.sha256(b"power_demand_predictor_admin").hexdigest()[:32],
-    "read": "pdp_read_" + hashlib.sha256(b"power_demand_predictor_read").hexdigest()[:32],
+    "admin": "pdp_admin_2e28eeffdb6f32459425874a323fa7a4",
+    "read": "pdp_read_f886dc534e13472b775aad0f7fbf4e22",
+}
+
+# Encoded API key -> role, matched with hmac.compare_digest (no hash lookup on the raw key)
+_KEY_TO_ROLE_BYTES = {key.encode(): role for role, key in API_KEYS.items()}
+
+# Invalid API key log throttling: one warning per key prefix per interval, plus a
+# global token bucket so random-key floods cannot raise the log rate. Suppressed
+# counts are summarized once per flush interval, when the prefix table is also reset.
+# Throttling is keyed on the key prefix, not the client IP: the auth dependency does
+# not receive the request, and one client rotating keys is caught by the global bucket.
+_INVALID_KEY_LOG_INTERVAL = 10.0
+_INVALID_KEY_FLUSH_INTERVAL = 60.0
+_INVALID_KEY_MAX_WARNINGS = 20  # per flush interval, across all prefixes
+_INVALID_KEY_MAX_PREFIXES = 1024
+_invalid_key_last_logged: Dict[str, float] = {}
+_invalid_key_state = {
+    "tokens": float(_INVALID_KEY_MAX_WARNINGS),
+    "refilled_at": 0.0,
+    "suppressed": 0,
+    "next_flush": 0.0,
 }
 
+
+def _log_invalid_key_attempt(api_key: str) -> None:
+    """Log an invalid API key attempt, collapsing repeated prefixes and bursts"""
+    now = time.monotonic()
+    prefix = api_key[:10]
+    state = _invalid_key_state
+
+    if now >= state["next_flush"]:
+        if state["suppressed"]:
+            logger.warning("Suppressed %d invalid API key attempts", state["suppressed"])
+        state["suppressed"] = 0
+        _invalid_key_last_logged.clear()
+        state["next_flush"] = now + _INVALID_KEY_FLUSH_INTERVAL
+
+    last = _invalid_key_last_logged.get(prefix)
+    if last is not None and now - last < _INVALID_KEY_LOG_INTERVAL:
+        state["suppressed"] += 1
+        return
+
+    # Refill the global bucket at _INVALID_KEY_MAX_WARNINGS per flush interval
+    elapsed = now - state["refilled_at"]
+    state["tokens"] = min(
+        float(_INVALID_KEY_MAX_WARNINGS),
+        state["tokens"] + elapsed * _INVALID_KEY_MAX_WARNINGS / _INVALID_KEY_FLUSH_INTERVAL,
+    )
+    state["refilled_at"] = now
+    if state["tokens"] < 1.0:
+        state["suppressed"] += 1
+        return
+    state["tokens"] -= 1.0
+
+    if prefix in _invalid_key_last_logged or len(_invalid_key_last_logged) < _INVALID_KEY_MAX_PREFIXES:
+        _invalid_key_last_logged[prefix] = now
+    logger.warning("Invalid API key attempt: %s...", prefix)
+
+
 class SecurityValidator:
     """Security validation utilities"""
     
@@ -170,14 +230,14 @@ class APIKeyAuth:
             )
         
         # Validate API key
-        user_role = None
-        for role, valid_key in API_KEYS.items():
-            if api_key == valid_key:
-                user_role = role
-                break
+        # Constant-time compare against every configured key
+        key_bytes = api_key.encode()
+        user_role = next(
+            (role for key, role in _KEY_TO_ROLE_BYTES.items() if hmac.compare_digest(key_bytes, key)), None
+        )
         
         if not user_role:
-            logger.warning(f"Invalid API key attempt: {api_key[:10]}...")
+            _log_invalid_key_attempt(api_key)
             raise HTTPException(
                 status_code=401,
                 detail="Invalid API key"
@@ -188,7 +248,7 @@ class APIKeyAuth:
         return {
             "role": user_role,
             "api_key": api_key,
-            "authenticated_at": datetime.now().isoformat()
+            "authenticated_at": iso_now()
         }
     
     async def require_admin(
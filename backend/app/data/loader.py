@@ -1,11 +1,148 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+import codecs
+import csv
+import fnmatch
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import re
+from functools import lru_cache
+import time
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import numpy as np
 from pathlib import Path
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import charset_normalizer
+    CHARSET_NORMALIZER_AVAILABLE = True
+except ImportError:
+    CHARSET_NORMALIZER_AVAILABLE = False
+
 MARKER_CANDIDATES = [".active_csv", ".active_csv.csv"]
 
+# CSV 탐색 패턴 (우선순위 순서, 처음 매칭되는 패턴의 파일만 사용)
+CSV_PATTERNS = [
+    "충전이력*.csv",
+    "charging_sessions*.csv",
+    "sessions*.csv",
+    "*sessions*.csv",
+    "*.csv",
+]
+
+# 공휴일 (고정 공휴일)
+HOLIDAYS = frozenset({
+    date(2025, 1, 1),
+    date(2025, 3, 1),
+    date(2025, 5, 5),
+    date(2025, 6, 6),
+    date(2025, 8, 15),
+    date(2025, 10, 3),
+    date(2025, 12, 25),
+})
+
+# 월(1-12) -> 계절 (인덱스 0은 미사용)
+SEASON_LUT = (None, "겨울", "겨울", "봄", "봄", "봄", "여름", "여름", "여름", "가을", "가을", "가을", "겨울")
+
+# 충전소 ID 컬럼 후보 (우선순위 순서)
+STATION_COLUMNS = ["충전소ID", "충전소명", "station_id", "station_name"]
+
+# 청크 단위 스트리밍 읽기를 적용할 파일 크기 (MB) 및 청크 크기
+CHUNKED_READ_MB = 100
+CSV_CHUNK_SIZE = 100_000
+
+# PyArrow 멀티스레드 파서를 사용할 파일 크기 (MB)
+ARROW_READ_MB = 50
+
+# CSV 파일 탐색/활성 마커 결과 캐시 유지 시간 (초)
+FILE_CACHE_TTL = 2.0
+
+# Parquet 사이드카 캐시 형식 버전 (전처리 로직 변경 시 증가)
+SIDECAR_VERSION = 4
+# 사이드카 파일 접미사 (<csv>.parquet, <csv>.meta.json)
+SIDECAR_SUFFIXES = (".parquet", ".meta.json")
+
+# 날짜 문자열 후보 형식 (우선순위 순서)
+DATE_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",  # ISO format
+    "%Y-%m-%d %H:%M:%S.%f",  # ISO with microseconds
+    "%Y/%m/%d %H:%M:%S",  # Slash separated
+    "%d/%m/%Y %H:%M:%S",  # Day first
+)
+
+# 컬럼명 패턴 (날짜 / 숫자)
+DATE_PATTERNS = ["일시", "date", "time", "시간"]
+NUMERIC_PATTERNS = ["전력", "전압", "전류", "kWh", "SOC", "시간", "금액", "량"]
+
+# 컬럼 분류용 정규식 (분류별 1회 컴파일)
+COLUMN_CLASS_PATTERNS = {
+    "date": re.compile("|".join(map(re.escape, DATE_PATTERNS))),
+    "numeric": re.compile("|".join(map(re.escape, NUMERIC_PATTERNS))),
+    "start": re.compile(r"시작일시|(?i:start)"),
+    "power": re.compile(r"전력"),
+    "id": re.compile(r"ID|id"),
+    # category 변환 대상: 카디널리티가 낮은 충전소/충전기 ID만 (세션ID 등 행마다 고유한 ID 제외)
+    "category_id": re.compile(r"^\s*(?:충전소ID|충전기ID|(?i:station_id|charger_id))\s*$"),
+}
+
+
+@lru_cache(maxsize=64)
+def _classify_column_names(columns: Tuple[str, ...]) -> Dict[str, Tuple[str, ...]]:
+    return {
+        name: tuple(col for col in columns if pattern.search(col))
+        for name, pattern in COLUMN_CLASS_PATTERNS.items()
+    }
+
+
+def _classify_columns(columns) -> Dict[str, Tuple[str, ...]]:
+    # 컬럼명 목록별로 분류 결과를 캐시하여 파이프라인 단계마다 재스캔하지 않음
+    return _classify_column_names(tuple(str(col) for col in columns))
+
+
+# 유효 전력 범위 (kW, 양 끝 제외)
+POWER_MIN_KW = 0
+POWER_MAX_KW = 1000
+
+
+# 숫자 변환 전 제거할 문자 (천단위 쉼표, 공백)
+NUMERIC_STRIP_TABLE = str.maketrans("", "", ", \t")
+NUMERIC_STRIP_PATTERN = "[, \t]"
+
+
+def _strip_numeric_strings(values: pd.Series) -> pd.Series:
+    # 문자열에서 숫자가 아닌 문자 제거 (쉼표, 공백 등)를 한 번에 처리 (pyarrow 있으면 벡터 치환)
+    as_str = values.astype(str)
+    if PYARROW_AVAILABLE:
+        stripped = pc.replace_substring_regex(pa.array(as_str, type=pa.string()), NUMERIC_STRIP_PATTERN, "")
+        return pd.Series(stripped.to_numpy(zero_copy_only=False), index=values.index)
+    return as_str.str.translate(NUMERIC_STRIP_TABLE)
+
+
+def remove_parquet_sidecars(csv_file: Path) -> None:
+    # 사이드카는 원본 데이터 전체의 사본이므로 CSV 삭제/교체 시 함께 삭제
+    csv_file = Path(csv_file)
+    for suffix in SIDECAR_SUFFIXES:
+        csv_file.with_name(csv_file.name + suffix).unlink(missing_ok=True)
+
+
+def remove_orphan_sidecars(data_dir: Path) -> int:
+    # 원본 CSV가 없는 사이드카 정리, 삭제한 파일 수 반환
+    removed = 0
+    for suffix in SIDECAR_SUFFIXES:
+        for sidecar in Path(data_dir).glob(f"*.csv{suffix}"):
+            if not sidecar.with_name(sidecar.name[: -len(suffix)]).exists():
+                sidecar.unlink(missing_ok=True)
+                removed += 1
+    return removed
+
 
 class ChargingDataLoader:
     def __init__(self, station_id: str, data_dir: str = None):
@@ -28,28 +165,58 @@ class ChargingDataLoader:
 
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
+        # (timestamp, 결과) 형태의 파일 탐색 캐시
+        self._file_cache = None
+        self._active_csv_cache = None
+        # 컬럼별로 마지막에 판별된 날짜 형식
+        self._date_formats: Dict[str, str] = {}
+
+    def invalidate_file_cache(self) -> None:
+        # CSV 추가/삭제나 활성 마커 변경 후 호출
+        self._file_cache = None
+        self._active_csv_cache = None
+
     def _is_marker(self, p: Path) -> bool:
         return p.name in MARKER_CANDIDATES
 
     def get_active_csv_file(self) -> Optional[Path]:
         
+        now = time.monotonic()
+        if self._active_csv_cache and now - self._active_csv_cache[0] < FILE_CACHE_TTL:
+            return self._active_csv_cache[1]
+
+        active = self._read_active_marker()
+        self._active_csv_cache = (now, active)
+        return active
+
+    def _read_active_marker(self) -> Optional[Path]:
         for marker_name in MARKER_CANDIDATES:
             marker = self.data_dir / marker_name
-            if marker.exists():
+            try:
+                raw = marker.read_bytes()
+            except OSError:
+                continue
+
+            # 마커는 파일명 한 줄이므로 BOM 제거 후 한 번만 디코딩
+            if raw.startswith(b"\xef\xbb\xbf"):
+                raw = raw[3:]
+            first_line = raw.split(b"\n", 1)[0].strip()
+            if not first_line:
+                continue
+
+            name = first_line.decode("utf-8", errors="replace")
+            p = (self.data_dir / Path(name).name).resolve()
+            if p.exists():
+                return p
+
+            # UTF-8이 아닌 레거시 마커 (cp949/euc-kr)
+            if "\ufffd" in name:
                 try:
-                    # 다양한 인코딩으로 마커 파일 읽기 시도
-                    for encoding in ["utf-8", "cp949", "euc-kr", "utf-8-sig"]:
-                        try:
-                            first_line = marker.read_text(encoding=encoding).splitlines()[0].strip()
-                            if first_line:
-                                p = (self.data_dir / Path(first_line).name).resolve()
-                                if p.exists():
-                                    return p
-                            break  # 성공하면 다른 인코딩 시도하지 않음
-                        except (UnicodeDecodeError, UnicodeError):
-                            continue
-                except Exception:
-                    continue
+                    p = (self.data_dir / Path(first_line.decode("cp949")).name).resolve()
+                    if p.exists():
+                        return p
+                except UnicodeDecodeError:
+                    pass
         return None
 
     def get_latest_csv_file(self) -> Optional[Path]:
@@ -57,39 +224,65 @@ class ChargingDataLoader:
         files = self.find_csv_files()
         if not files:
             return None
-        files_sorted = sorted(files, key=lambda f: f.stat().st_mtime, reverse=True)
-        return files_sorted[0]
+        # find_csv_files는 이미 수정시각 내림차순으로 정렬됨
+        return files[0]
 
-    def find_csv_files(self) -> List[Path]:
-        
-        csv_files = []
-        patterns = [
-            "충전이력*.csv",
-            "charging_sessions*.csv",
-            "sessions*.csv",
-            "*sessions*.csv",
-            "*.csv",
-        ]
-        for pattern in patterns:
-            files = list(self.data_dir.glob(pattern))
-            # 마커 제외
-            files = [f for f in files if not self._is_marker(f)]
-            csv_files.extend(files)
-            if files:
-                break
+    def _scan_csvs(self) -> List[Tuple[Path, os.stat_result]]:
+        # 단일 scandir 패스로 CSV 파일과 stat 정보를 수집 (DirEntry.stat() 캐시 재사용)
+        now = time.monotonic()
+        if self._file_cache and now - self._file_cache[0] < FILE_CACHE_TTL:
+            return list(self._file_cache[1])
 
-        csv_files = list(set(csv_files))
+        entries = []
         try:
-            csv_files = sorted(csv_files, key=lambda f: f.stat().st_mtime, reverse=True)
-        except Exception:
-            pass
+            with os.scandir(self.data_dir) as it:
+                for entry in it:
+                    if entry.name in MARKER_CANDIDATES:
+                        continue
+                    try:
+                        if entry.is_file():
+                            entries.append(entry)
+                    except OSError:
+                        continue
+        except OSError:
+            return []
+
+        matched = []
+        for pattern in CSV_PATTERNS:
+            matched = [e for e in entries if fnmatch.fnmatch(e.name, pattern)]
+            if matched:
+                break
+
+        scanned = []
+        for entry in matched:
+            try:
+                scanned.append((self.data_dir / entry.name, entry.stat()))
+            except OSError:
+                continue
+
+        scanned.sort(key=lambda item: item[1].st_mtime, reverse=True)
+        self._file_cache = (now, scanned)
+        return list(scanned)
+
+    def find_csv_files(self) -> List[Path]:
+        
+        csv_files = [path for path, _ in self._scan_csvs()]
 
         if not csv_files:
             print(f"CSV 파일을 찾을 수 없습니다. 검색 경로: {self.data_dir}")
 
         return csv_files
 
-    def load_csv_file(self, csv_file: Path = None, encoding: str = "utf-8", max_rows: int = None) -> pd.DataFrame:
+    def load_csv_file(
+        self,
+        csv_file: Path = None,
+        encoding: str = "utf-8",
+        max_rows: int = None,
+        usecols: List[str] = None,
+        station_id: str = None,
+    ) -> pd.DataFrame:
+        # usecols 지정 시 해당 컬럼만 파싱 (헤더에 없는 이름은 무시)
+        # station_id 지정 시 대용량 파일은 청크 단위로 읽으면서 해당 충전소 행만 유지
         
         if csv_file is None:
             # 활성 파일 > 최신 파일 순서로 선택 (항상 data/raw 내부)
@@ -106,31 +299,56 @@ class ChargingDataLoader:
 
         # 파일 크기 체크
         file_size_mb = csv_file.stat().st_size / (1024 * 1024)
-        if file_size_mb > 500:  # 500MB 이상
+        stream_station = station_id is not None and file_size_mb > CHUNKED_READ_MB
+        if file_size_mb > 500 and not stream_station:  # 500MB 이상
             print(f"⚠️ 대용량 파일 ({file_size_mb:.1f}MB) - 샘플링 모드로 로드")
             max_rows = max_rows or 50000  # 5만개 행 제한
 
 
-        # 다양한 인코딩 시도
+        # 파일 앞부분으로 인코딩을 한 번 감지하고, 실패 시에만 다양한 인코딩 시도
         encodings = [encoding, "utf-8", "euc-kr", "cp949", "utf-8-sig"]
+        detected = self._detect_encoding(csv_file)
+        if detected:
+            encodings = [detected] + [enc for enc in encodings if enc != detected]
 
         for enc in encodings:
             try:
 
                 # 먼저 샘플로 테스트
-                sample_df = pd.read_csv(csv_file, nrows=5, encoding=enc)
+                sample_df = self._read_csv(csv_file, nrows=5, encoding=enc)
+                columns = list(sample_df.columns)
+                if usecols is not None:
+                    wanted = set(usecols)
+                    columns = [col for col in columns if col.strip() in wanted]
+                read_options = self._build_read_options(columns)
+                if usecols is not None:
+                    read_options["usecols"] = columns
 
                 # 전체 데이터 로드 (메모리 효율성을 위해 청크 읽기)
-                if max_rows and file_size_mb > 100:
-                    # 대용량 파일은 청크로 읽기
+                if (max_rows or stream_station) and file_size_mb > CHUNKED_READ_MB:
+                    # 대용량 파일은 청크로 읽기 (충전소 필터는 청크마다 적용하여 메모리 절감)
                     chunks = []
-                    for chunk in pd.read_csv(csv_file, dtype=str, low_memory=True, encoding=enc, chunksize=10000):
+                    rows_read = 0
+                    for chunk in self._read_csv(csv_file, encoding=enc, chunksize=CSV_CHUNK_SIZE, **read_options):
+                        if stream_station:
+                            chunk = self._filter_chunk_by_station(chunk, station_id)
                         chunks.append(chunk)
-                        if len(pd.concat(chunks, ignore_index=True)) >= max_rows:
+                        rows_read += len(chunk)
+                        if max_rows and rows_read >= max_rows:
                             break
-                    df = pd.concat(chunks, ignore_index=True)[:max_rows]
+                    df = pd.concat(chunks, ignore_index=True)
+                    if max_rows:
+                        df = df.iloc[:max_rows]
+                elif PYARROW_AVAILABLE and not max_rows and file_size_mb > ARROW_READ_MB:
+                    # 대용량 파일은 PyArrow 멀티스레드 파서로 읽기
+                    # 필드 수가 모자란 행이나 블록 간 타입 불일치는 Arrow가 거부하므로 pandas로 다시 읽음
+                    try:
+                        df = self._read_csv_arrow(csv_file, enc, read_options)
+                    except pa.ArrowException as e:
+                        print(f"PyArrow 파싱 실패, pandas로 재시도: {e}")
+                        df = self._read_csv(csv_file, encoding=enc, **read_options)
                 else:
-                    df = pd.read_csv(csv_file, dtype=str, low_memory=True, encoding=enc, nrows=max_rows)
+                    df = self._read_csv(csv_file, encoding=enc, nrows=max_rows, **read_options)
 
                 return df
 
@@ -142,47 +360,132 @@ class ChargingDataLoader:
         print("모든 인코딩 시도 실패")
         return pd.DataFrame()
 
+    def _read_header(self, csv_file: Path) -> List[str]:
+        # pandas 파서 없이 첫 줄만 읽어 컬럼명 추출 (따옴표 안의 쉼표 처리)
+        try:
+            with open(csv_file, "rb") as f:
+                raw = f.readline()
+        except OSError:
+            return []
+
+        for encoding in ("utf-8-sig", "cp949"):
+            try:
+                line = raw.decode(encoding)
+                break
+            except UnicodeDecodeError:
+                continue
+        else:
+            line = raw.decode("utf-8", errors="replace")
+
+        line = line.rstrip("\r\n")
+        if not line:
+            return []
+        return next(csv.reader([line]))
+
+    def _read_csv(self, csv_file: Path, **kwargs):
+        # 메모리 맵으로 읽어 버퍼 복사를 줄이고, mmap 실패 시 (예: Windows 대용량 파일) 일반 읽기
+        try:
+            return pd.read_csv(csv_file, memory_map=True, **kwargs)
+        except OSError:
+            return pd.read_csv(csv_file, **kwargs)
+
+    def _detect_encoding(self, csv_file: Path) -> Optional[str]:
+        
+        try:
+            with open(csv_file, "rb") as f:
+                head = f.read(65536)
+        except OSError:
+            return None
+
+        if head.startswith(codecs.BOM_UTF8):
+            return "utf-8-sig"
+
+        # 대부분의 파일은 UTF-8이므로 먼저 확인 (끝에서 잘린 멀티바이트 문자는 허용)
+        try:
+            codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+            return "utf-8"
+        except UnicodeDecodeError:
+            pass
+
+        if CHARSET_NORMALIZER_AVAILABLE:
+            best = charset_normalizer.from_bytes(head).best()
+            if best is not None:
+                return best.encoding
+        return None
+
+    def _filter_chunk_by_station(self, chunk: pd.DataFrame, station_id: str) -> pd.DataFrame:
+        station_col = next((col for col in chunk.columns if col.strip() in STATION_COLUMNS), None)
+        if station_col is None:
+            return chunk
+        mask = (chunk[station_col].str.strip() == station_id.strip()).to_numpy(dtype=bool, na_value=False)
+        return chunk[mask]
+
+    def _build_read_options(self, columns) -> Dict:
+        # C 파서가 숫자 컬럼을 직접 변환하도록 컬럼별 타입 지정
+        # 날짜 컬럼은 _convert_data_types의 형식 지정 파싱을 위해, ID 등 나머지 컬럼은
+        # 선행 0 보존을 위해 문자열 유지
+        col_classes = _classify_columns(columns)
+        date_cols = col_classes["date"]
+        numeric_cols = [col for col in col_classes["numeric"] if col not in date_cols]
+        dtype_map = {col: str for col in columns if col not in numeric_cols}
+
+        return {
+            "dtype": dtype_map,
+            "thousands": ",",
+            "engine": "c",
+            "low_memory": False,
+        }
+
+    def _read_csv_arrow(self, csv_file: Path, encoding: str, read_options: Dict) -> pd.DataFrame:
+        # 문자열 컬럼은 pandas 경로와 동일하게 유지, 나머지는 Arrow 타입 추론
+        table = pa_csv.read_csv(
+            csv_file,
+            read_options=pa_csv.ReadOptions(block_size=64 << 20, encoding=encoding),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={col: pa.string() for col in read_options["dtype"]},
+                include_columns=read_options.get("usecols"),
+                strings_can_be_null=True,
+            ),
+        )
+        return table.to_pandas(self_destruct=True, split_blocks=True)
+
     def load_historical_sessions(self, days: int = 90, csv_file: str = None, merge_all: bool = False) -> pd.DataFrame:
         
 
         # CSV 파일 지정
         if csv_file:
             target_file = (self.data_dir / Path(csv_file).name).resolve()
-            df = self.load_csv_file(target_file)
+        elif not merge_all:
+            # 활성 파일 > 최신 파일 사용 (활성 마커가 있으면 디렉토리 탐색 생략)
+            target_file = self.get_active_csv_file() or self.get_latest_csv_file()
+            if target_file is None:
+                print("CSV 파일을 찾을 수 없습니다.")
+                return pd.DataFrame()
         else:
             csv_files = self.find_csv_files()
             if not csv_files:
                 print("CSV 파일을 찾을 수 없습니다.")
                 return pd.DataFrame()
-            if merge_all:
-                dfs = []
-                for f in csv_files:
-                    df_i = self.load_csv_file((self.data_dir / f.name).resolve())
-                    if not df_i.empty:
-                        dfs.append(df_i)
+            target_file = None
+
+        try:
+            if target_file is None:
+                # 파일별 파싱은 서로 독립적이므로 병렬로 로드 (C 파서는 GIL 해제)
+                targets = [(self.data_dir / f.name).resolve() for f in csv_files]
+                with ThreadPoolExecutor(max_workers=min(8, len(targets))) as executor:
+                    dfs = [df_i for df_i in executor.map(self.load_csv_file, targets) if not df_i.empty]
                 if not dfs:
                     print("읽을 수 있는 CSV가 없습니다.")
                     return pd.DataFrame()
-                df = pd.concat(dfs, ignore_index=True)
+                df = self._prepare_sessions(pd.concat(dfs, ignore_index=True))
             else:
-                # 활성 파일 > 최신 파일 사용
-                target_file = self.get_active_csv_file() or self.get_latest_csv_file()
-                if target_file is None:
-                    print("읽을 수 있는 CSV가 없습니다.")
-                    return pd.DataFrame()
-                df = self.load_csv_file(target_file)
+                # 단일 파일은 Parquet 사이드카 캐시 사용
+                df = self._load_prepared_file(target_file)
 
-        try:
-            # CSV 파일 로드
             if df.empty:
                 print("CSV 파일이 비어있습니다.")
                 return pd.DataFrame()
 
-            # 데이터 처리 파이프라인
-            df = self._normalize_column_names(df)
-            df = self._convert_data_types(df)
-            df = self._clean_data(df)
-
             # 특정 충전소 필터링
             if self.station_id != "ALL":
                 df = self._filter_by_station(df)
@@ -197,40 +500,134 @@ class ChargingDataLoader:
             print(f"CSV 로딩 중 오류 발생: {e}")
             return pd.DataFrame()
 
+    def load_prepared_sessions(self, csv_file: str = None) -> pd.DataFrame:
+        # 날짜/충전소 필터 없이 정규화·타입 변환·정제된 전체 데이터 (Parquet 사이드카 캐시 사용)
+        if csv_file:
+            target_file = (self.data_dir / Path(csv_file).name).resolve()
+        else:
+            target_file = self.get_active_csv_file() or self.get_latest_csv_file()
+            if target_file is None:
+                print("로드할 CSV 파일이 없습니다.")
+                return pd.DataFrame()
+
+        try:
+            return self._load_prepared_file(target_file)
+        except Exception as e:
+            print(f"CSV 로딩 중 오류 발생: {e}")
+            return pd.DataFrame()
+
+    def _prepare_sessions(self, df: pd.DataFrame) -> pd.DataFrame:
+        # 데이터 처리 파이프라인
+        df = self._normalize_column_names(df)
+        df = self._convert_data_types(df)
+        df = self._clean_data(df)
+        return df
+
+    def _load_prepared_file(self, csv_file: Path) -> pd.DataFrame:
+        
+        cached = self._read_parquet_sidecar(csv_file)
+        if cached is not None:
+            return cached
+
+        # 대용량 파일의 특정 충전소 조회는 읽으면서 필터링 (부분 데이터이므로 캐시하지 않음)
+        csv_path = (self.data_dir / Path(csv_file).name).resolve()
+        if self.station_id != "ALL" and csv_path.stat().st_size / (1024 * 1024) > CHUNKED_READ_MB:
+            df = self.load_csv_file(csv_path, station_id=self.station_id)
+            return self._prepare_sessions(df) if not df.empty else df
+
+        # 캐시 키는 읽기 전에 확보 (처리 중 CSV가 교체되면 이전 데이터가 새 키로 저장되지 않도록)
+        stat = csv_path.stat()
+        df = self.load_csv_file(csv_file)
+        if df.empty:
+            return df
+
+        df = self._prepare_sessions(df)
+        self._write_parquet_sidecar(csv_file, df, stat)
+        return df
+
+    def _sidecar_paths(self, csv_file: Path) -> Tuple[Path, Path]:
+        csv_file = (self.data_dir / Path(csv_file).name).resolve()
+        sidecar, meta_file = (csv_file.with_name(csv_file.name + suffix) for suffix in SIDECAR_SUFFIXES)
+        return sidecar, meta_file
+
+    def _read_parquet_sidecar(self, csv_file: Path) -> Optional[pd.DataFrame]:
+        # 원본 CSV의 mtime/size가 일치할 때만 캐시 사용
+        if not PYARROW_AVAILABLE:
+            return None
+
+        sidecar, meta_file = self._sidecar_paths(csv_file)
+        try:
+            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            stat = (self.data_dir / Path(csv_file).name).stat()
+            if (
+                meta.get("version") != SIDECAR_VERSION
+                or meta.get("mtime") != stat.st_mtime
+                or meta.get("size") != stat.st_size
+            ):
+                return None
+            return pd.read_parquet(sidecar, engine="pyarrow")
+        except Exception:
+            return None
+
+    def _write_parquet_sidecar(self, csv_file: Path, df: pd.DataFrame, stat: os.stat_result) -> None:
+        # stat: CSV를 읽기 전에 얻은 원본 파일 정보
+        if not PYARROW_AVAILABLE:
+            return
+
+        sidecar, meta_file = self._sidecar_paths(csv_file)
+        # 임시 파일에 쓴 뒤 os.replace로 교체 (중단/동시 읽기 시 잘린 파일 노출 방지)
+        suffix = f".{os.getpid()}.tmp"
+        tmp_sidecar = sidecar.with_name(sidecar.name + suffix)
+        tmp_meta = meta_file.with_name(meta_file.name + suffix)
+        try:
+            df.to_parquet(tmp_sidecar, engine="pyarrow", compression="zstd")
+            meta = {"version": SIDECAR_VERSION, "mtime": stat.st_mtime, "size": stat.st_size}
+            tmp_meta.write_text(json.dumps(meta), encoding="utf-8")
+            # 데이터를 먼저 교체하고 메타는 마지막에 교체하여, 메타가 가리키는 parquet는 항상 완전한 파일
+            meta_file.unlink(missing_ok=True)
+            os.replace(tmp_sidecar, sidecar)
+            os.replace(tmp_meta, meta_file)
+        except Exception as e:
+            print(f"Parquet 캐시 저장 실패: {e}")
+            tmp_sidecar.unlink(missing_ok=True)
+            tmp_meta.unlink(missing_ok=True)
+
     def _filter_by_station(self, df: pd.DataFrame) -> pd.DataFrame:
         
-        station_columns = ["충전소ID", "충전소명", "station_id", "station_name"]
         station_col = None
 
-        for col in station_columns:
+        for col in STATION_COLUMNS:
             if col in df.columns:
                 station_col = col
                 break
 
         if station_col:
             original_count = len(df)
-            # 디버깅: 실제 데이터에서 고유값 확인 (필터링 전)
-            unique_stations = df[station_col].unique()
-            print(f"전체 충전소 수: {len(unique_stations)}")
-            
-            # 실제 필터링 수행
-            df_filtered = df[df[station_col] == self.station_id]
+            # 공백 제거된 ID를 한 번만 계산하여 필터링과 진단에 재사용
+            target_id = self.station_id.strip()
+            station_values = df[station_col]
+            if isinstance(station_values.dtype, pd.CategoricalDtype):
+                # category는 고유값(카테고리)만 비교한 뒤 정수 코드로 마스크 생성
+                stripped = station_values.cat.categories.str.strip()
+                matched_codes = np.flatnonzero(stripped == target_id)
+                mask = np.isin(station_values.cat.codes.to_numpy(), matched_codes)
+            else:
+                stripped = station_values.str.strip()
+                mask = (stripped == target_id).to_numpy(dtype=bool, na_value=False)
+
+            df_filtered = df[mask]
             filtered_count = len(df_filtered)
             print(f"충전소 '{self.station_id}' 필터링: {original_count:,} → {filtered_count:,}개 세션")
 
             if filtered_count == 0:
+                unique_stations = pd.Series(stripped).dropna().unique()
+                print(f"전체 충전소 수: {len(unique_stations)}")
                 print(f"경고: 충전소 '{self.station_id}'에 대한 데이터가 없습니다.")
                 # 유사한 충전소 ID가 있는지 확인
-                similar_stations = [sid for sid in unique_stations if self.station_id.lower() in sid.lower() or sid.lower() in self.station_id.lower()]
+                target_lower = target_id.lower()
+                similar_stations = [sid for sid in unique_stations if target_lower in sid.lower() or sid.lower() in target_lower]
                 if similar_stations:
                     print(f"유사한 충전소 ID 발견: {similar_stations}")
-                
-                # 공백이나 특수문자 문제 확인
-                station_id_variants = df[station_col].str.strip().unique()
-                if self.station_id.strip() in station_id_variants:
-                    print(f"공백 문제 감지: 원본='{self.station_id}', 공백제거 후 재시도")
-                    df_filtered = df[df[station_col].str.strip() == self.station_id.strip()]
-                    print(f"공백 제거 후 결과: {len(df_filtered)}개 세션")
             
             return df_filtered
         else:
@@ -241,14 +638,14 @@ class ChargingDataLoader:
 
     def list_available_files(self) -> Dict:
         
-        csv_files = self.find_csv_files()
+        scanned = self._scan_csvs()
+        csv_files = [path for path, _ in scanned]
 
         active = self.get_active_csv_file() or (csv_files[0] if csv_files else None)
         file_info = []
-        for file in csv_files:
+        for file, stat in scanned:
             try:
-                # 파일 기본 정보
-                stat = file.stat()
+                # 파일 기본 정보 (scandir에서 수집한 stat 재사용)
                 info = {
                     "filename": file.name,
                     "path": str(file.absolute()),
@@ -256,12 +653,12 @@ class ChargingDataLoader:
                     "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
                 }
 
-                # CSV 구조 정보 (처음 5행만 읽어서)
-                try:
-                    sample_df = pd.read_csv(file, nrows=5)
-                    info["columns"] = len(sample_df.columns)
-                    info["sample_columns"] = list(sample_df.columns)[:10]  # 처음 10개 컬럼만
-                except Exception:
+                # CSV 구조 정보 (헤더 한 줄만 읽어서)
+                header = self._read_header(file)
+                if header:
+                    info["columns"] = len(header)
+                    info["sample_columns"] = header[:10]  # 처음 10개 컬럼만
+                else:
                     info["columns"] = "unknown"
                     info["sample_columns"] = []
 
@@ -291,69 +688,63 @@ class ChargingDataLoader:
         
 
         # 날짜 컬럼 찾기 및 변환
-        date_patterns = ["일시", "date", "time", "시간"]
-        date_columns = [col for col in df.columns if any(pattern in col for pattern in date_patterns)]
+        col_classes = _classify_columns(df.columns)
+        date_columns = col_classes["date"]
 
         for col in date_columns:
+            # 이미 날짜형으로 변환된 컬럼은 건너뜀
+            if pd.api.types.is_datetime64_any_dtype(df[col]):
+                continue
             try:
-                # 먼저 샘플 데이터를 확인하여 형식을 추론
-                sample_data = df[col].dropna().head(10)
-                if len(sample_data) > 0:
-                    # 일반적인 한국 날짜 형식들을 시도
-                    date_formats = [
-                        "%Y-%m-%d %H:%M:%S",  # ISO format
-                        "%Y-%m-%d %H:%M:%S.%f",  # ISO with microseconds
-                        "%Y/%m/%d %H:%M:%S",  # Slash separated
-                        "%d/%m/%Y %H:%M:%S",  # Day first
-                        "mixed",  # Let pandas infer but with proper handling
-                    ]
-
-                    parsed_successfully = False
-                    for fmt in date_formats:
-                        try:
-                            if fmt == "mixed":
-                                # Use pandas default inference for mixed formats
-                                df[col] = pd.to_datetime(df[col], errors="coerce")
-                            else:
-                                df[col] = pd.to_datetime(df[col], format=fmt, errors="coerce")
-
-                            # Check if parsing was successful
-                            if df[col].notna().sum() > 0:
-                                parsed_successfully = True
-                                break
-                        except Exception:
-                            continue
-
-                    if not parsed_successfully:
-                        # Fallback to pandas default
-                        df[col] = pd.to_datetime(df[col], errors="coerce")
-                else:
-                    df[col] = pd.to_datetime(df[col], errors="coerce")
-
-                valid_dates = df[col].notna().sum()
+                # 샘플로 형식을 먼저 판별한 뒤 전체 컬럼은 형식 지정(C 파서)으로 한 번만 파싱
+                # 어떤 형식도 맞지 않으면 기본 ISO 형식으로 파싱 (dateutil 개별 파싱 생략)
+                date_format = self._detect_date_format(col, df[col]) or DATE_FORMATS[0]
+                df[col] = pd.to_datetime(df[col], format=date_format, errors="coerce")
             except Exception as e:
                 print(f"  {col} 날짜 변환 실패: {e}")
 
         # 숫자 컬럼 찾기 및 변환 (전력 관련 컬럼 우선 처리)
-        numeric_patterns = ["전력", "전압", "전류", "kWh", "SOC", "시간", "금액", "량"]
-        numeric_columns = [col for col in df.columns if any(pattern in col for pattern in numeric_patterns)]
+        numeric_columns = col_classes["numeric"]
 
         for col in numeric_columns:
             try:
-                # 문자열에서 숫자가 아닌 문자 제거 (쉼표, 공백 등)
-                df[col] = df[col].astype(str).str.replace(",", "", regex=False)
-                df[col] = df[col].str.replace(" ", "", regex=False)  # 공백 제거
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-                valid_numbers = df[col].notna().sum()
-                        
+                # 이미 숫자형이면 문자열 왕복 변환 생략
+                if pd.api.types.is_numeric_dtype(df[col]):
+                    continue
+                cleaned = _strip_numeric_strings(df[col])
+                df[col] = pd.to_numeric(cleaned, errors="coerce")
             except Exception as e:
                 print(f"  {col} 숫자 변환 실패: {e}")
 
+        # 충전소/충전기 ID 컬럼은 category로 변환 (정수 코드 비교, 메모리 절감)
+        for col in col_classes["category_id"]:
+            if col in numeric_columns or col in date_columns:
+                continue
+            if pd.api.types.is_object_dtype(df[col]) or pd.api.types.is_string_dtype(df[col]):
+                df[col] = df[col].astype("category")
+
         return df
 
+    def _detect_date_format(self, col: str, values: pd.Series) -> Optional[str]:
+        # 앞쪽 유효 샘플을 파싱할 수 있는 첫 형식 (직전에 성공한 형식을 우선 시도)
+        sample = values.dropna().head(10)
+        if sample.empty:
+            return None
+
+        cached = self._date_formats.get(col)
+        candidates = (cached,) + DATE_FORMATS if cached else DATE_FORMATS
+        for fmt in candidates:
+            try:
+                if pd.to_datetime(sample, format=fmt, errors="coerce").notna().any():
+                    self._date_formats[col] = fmt
+                    return fmt
+            except Exception:
+                continue
+        return None
+
     def _filter_by_days(self, df: pd.DataFrame, days: int) -> pd.DataFrame:
         
-        date_columns = [col for col in df.columns if "시작일시" in col or "start" in col.lower()]
+        date_columns = _classify_columns(df.columns)["start"]
 
         if not date_columns:
             print("날짜 필터링 불가: 적절한 날짜 컬럼을 찾을 수 없음")
@@ -367,8 +758,11 @@ class ChargingDataLoader:
 
         try:
             cutoff_date = datetime.now() - timedelta(days=days)
-            original_count = len(df)
-            df = df[df[date_col] >= cutoff_date]
+            dates = df[date_col]
+            if dates.is_monotonic_increasing:
+                # 시간순 정렬된 데이터는 이진 탐색 후 슬라이스 (전체 스캔/마스크 생략)
+                return df.iloc[dates.searchsorted(pd.Timestamp(cutoff_date), side="left"):]
+            df = df[dates >= cutoff_date]
             return df
         except Exception as e:
             print(f"날짜 필터링 중 오류: {e}")
@@ -379,11 +773,15 @@ class ChargingDataLoader:
         original_size = len(df)
 
         # 전력 컬럼 찾기
-        power_columns = [col for col in df.columns if "전력" in col]
+        power_columns = _classify_columns(df.columns)["power"]
         if power_columns:
             power_col = power_columns[0]
             before = len(df)
-            df = df[(df[power_col] > 0) & (df[power_col] < 1000)]
+            values = df[power_col].to_numpy()
+            if values.dtype.kind in "fiu":
+                df = df[(values > POWER_MIN_KW) & (values < POWER_MAX_KW)]
+            else:
+                df = df[(df[power_col] > POWER_MIN_KW) & (df[power_col] < POWER_MAX_KW)]
             removed = before - len(df)
 
         retention_rate = (len(df) / original_size * 100) if original_size > 0 else 0
@@ -409,16 +807,7 @@ class ChargingDataLoader:
         
         current_date = datetime.now()
 
-        holidays = [
-            "2025-01-01",
-            "2025-03-01",
-            "2025-05-05",
-            "2025-06-06",
-            "2025-08-15",
-            "2025-10-03",
-            "2025-12-25",
-        ]
-        is_holiday = current_date.strftime("%Y-%m-%d") in holidays
+        is_holiday = current_date.date() in HOLIDAYS
 
         return {
             "date": current_date.date().isoformat(),
@@ -433,14 +822,7 @@ class ChargingDataLoader:
 
     def _get_season(self, month: int) -> str:
         
-        if month in [3, 4, 5]:
-            return "봄"
-        elif month in [6, 7, 8]:
-            return "여름"
-        elif month in [9, 10, 11]:
-            return "가을"
-        else:
-            return "겨울"
+        return SEASON_LUT[month]
 
     def get_data_summary(self) -> Dict:
         
@@ -470,7 +852,7 @@ class ChargingDataLoader:
                 }
 
             # 전력 통계 (전력 컬럼 자동 탐지)
-            power_columns = [col for col in df.columns if "전력" in col]
+            power_columns = _classify_columns(df.columns)["power"]
             if power_columns:
                 power_col = power_columns[0]
                 power_data = df[power_col].dropna()
@@ -484,7 +866,7 @@ class ChargingDataLoader:
                     }
 
             # 고유값 개수 (ID 컬럼 자동 탐지)
-            id_columns = [col for col in df.columns if "ID" in col or "id" in col]
+            id_columns = _classify_columns(df.columns)["id"]
             for col in id_columns:
                 if "충전소" in col:
                     summary["unique_stations"] = df[col].nunique()
@@ -496,6 +878,28 @@ class ChargingDataLoader:
         except Exception as e:
             return {"error": f"데이터 요약 생성 실패: {str(e)}"}
 
+    def _hour_month_codes(self, dates: pd.Series):
+        # 유효 날짜 마스크, 시(0-23), 1970-01 기준 월 인덱스 정수 배열
+        if getattr(dates.dt, "tz", None) is not None:
+            dates = dates.dt.tz_localize(None)
+        valid = dates.notna().to_numpy()
+        values = dates.to_numpy()[valid]
+        # 그룹 키는 작은 정수 폭으로 축소 (시: int8, 월 인덱스: int32)
+        hour_codes = (values.astype("datetime64[h]").astype(np.int64) % 24).astype(np.int8)
+        month_codes = values.astype("datetime64[M]").astype(np.int64).astype(np.int32)
+        return valid, hour_codes, month_codes
+
+    def _hour_month_power_stats(self, power: pd.Series, hour_codes: np.ndarray, month_codes: np.ndarray) -> pd.DataFrame:
+        # (시, 년월) 구간별 sum/max/count — 정수 코드 키로 한 번만 그룹핑
+        return power.groupby([hour_codes, month_codes]).agg(["sum", "max", "count"])
+
+    def _rollup_power_stats(self, grouped: pd.DataFrame, level: int) -> pd.DataFrame:
+        # (시, 년월) 부분 집계(sum/max/count)를 한 축으로 합쳐 mean/max/count 산출
+        rolled = grouped.groupby(level=level).agg({"sum": "sum", "max": "max", "count": "sum"})
+        return pd.DataFrame(
+            {"mean": rolled["sum"] / rolled["count"], "max": rolled["max"], "count": rolled["count"]}
+        ).round(2)
+
     def analyze_charging_patterns(self) -> Dict:
         
         try:
@@ -512,35 +916,40 @@ class ChargingDataLoader:
             }
 
             # 전력 통계 (전력 컬럼 자동 탐지)
-            power_columns = [col for col in df.columns if "전력" in col]
+            power_columns = _classify_columns(df.columns)["power"]
             if power_columns:
                 power_col = power_columns[0]
                 power_data = df[power_col].dropna()
                 if not power_data.empty:
-                    power_stats = power_data.describe()
+                    # describe()/quantile() 반복 대신 배열 한 번에 백분위 계산
+                    arr = power_data.to_numpy(dtype=np.float64)
+                    p50, p75, p90, p95, p99 = np.quantile(arr, [0.5, 0.75, 0.9, 0.95, 0.99])
                     analysis["power_statistics"] = {
                         "column_name": power_col,
-                        "count": int(power_stats["count"]),
-                        "mean": round(power_stats["mean"], 2),
-                        "std": round(power_stats["std"], 2),
-                        "min": round(power_stats["min"], 2),
-                        "max": round(power_stats["max"], 2),
-                        "percentile_50": round(power_stats["50%"], 2),
-                        "percentile_75": round(power_stats["75%"], 2),
-                        "percentile_90": round(power_data.quantile(0.90), 2),
-                        "percentile_95": round(power_data.quantile(0.95), 2),
-                        "percentile_99": round(power_data.quantile(0.99), 2),
+                        "count": int(arr.size),
+                        "mean": round(arr.mean(), 2),
+                        "std": round(arr.std(ddof=1), 2) if arr.size > 1 else np.nan,
+                        "min": round(arr.min(), 2),
+                        "max": round(arr.max(), 2),
+                        "percentile_50": round(p50, 2),
+                        "percentile_75": round(p75, 2),
+                        "percentile_90": round(p90, 2),
+                        "percentile_95": round(p95, 2),
+                        "percentile_99": round(p99, 2),
                     }
 
-            # 시간대별 패턴 (날짜 컬럼 자동 탐지)
+            # 시간대별/월별 패턴 (날짜 컬럼 자동 탐지)
             date_columns = [col for col in df.columns if pd.api.types.is_datetime64_any_dtype(df[col])]
+            grouped = None
             if date_columns and power_columns:
                 date_col = date_columns[0]
                 power_col = power_columns[0]
 
                 try:
-                    df["hour"] = df[date_col].dt.hour
-                    hourly_stats = df.groupby("hour")[power_col].agg(["mean", "max", "count"]).round(2)
+                    # (시, 년월) 결합 키로 한 번만 그룹핑한 뒤 각 축으로 롤업
+                    valid, hour_codes, month_codes = self._hour_month_codes(df[date_col])
+                    grouped = self._hour_month_power_stats(df[power_col][valid], hour_codes, month_codes)
+                    hourly_stats = self._rollup_power_stats(grouped, level=0)
 
                     if not hourly_stats.empty:
                         analysis["hourly_patterns"] = {
@@ -564,23 +973,21 @@ class ChargingDataLoader:
                     print(f"시간대별 패턴 분석 오류: {e}")
 
             # 월별 패턴 생성 (차트 데이터용)
-            if date_columns and power_columns:
+            if grouped is not None:
                 try:
                     date_col = date_columns[0]
-                    power_col = power_columns[0]
                     
-                    # 년-월 조합으로 그룹핑 (정확한 시계열 데이터)
-                    df["year_month"] = df[date_col].dt.strftime("%Y-%m")
-                    monthly_stats = df.groupby("year_month")[power_col].agg(["mean", "max", "count"]).round(2)
+                    # 년-월 조합으로 롤업 (정확한 시계열 데이터, 1970-01 기준 월 인덱스)
+                    monthly_stats = self._rollup_power_stats(grouped, level=1)
                     
                     if not monthly_stats.empty:
                         analysis["monthly_patterns"] = {
-                            year_month: {
+                            f"{month_idx // 12 + 1970:04d}-{month_idx % 12 + 1:02d}": {
                                 "avg_power": float(row["mean"]) if pd.notna(row["mean"]) else 0,
                                 "max_power": float(row["max"]) if pd.notna(row["max"]) else 0,
                                 "session_count": int(row["count"]),
                             }
-                            for year_month, row in monthly_stats.iterrows()
+                            for month_idx, row in monthly_stats.iterrows()
                         }
                         
                     # 날짜 범위 정보 추가
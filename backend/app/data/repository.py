@@ -1,11 +1,38 @@
 from typing import Dict, List, Optional, Any
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from pathlib import Path
 import logging
+import os
+import pickle
+import weakref
+from functools import lru_cache
 
 from .loader import ChargingDataLoader
 from ..models.entities import ChargingStation, ChargingSession
 
+# 충전소 목록 디스크 캐시 (데이터 디렉터리, 원본 CSV mtime/size 기준 무효화)
+STATIONS_CACHE_FILE = ".stations_cache.pkl"
+STATIONS_CACHE_VERSION = 1
+
+
+# Live shared loaders (entries evicted from the lru_cache drop out automatically)
+_shared_loaders: "weakref.WeakSet[ChargingDataLoader]" = weakref.WeakSet()
+
+
+@lru_cache(maxsize=128)
+def _get_loader(station_id: str) -> ChargingDataLoader:
+    # Shared per-station loader so repeated calls reuse its file-scan caches
+    loader = ChargingDataLoader(station_id)
+    _shared_loaders.add(loader)
+    return loader
+
+
+def invalidate_loader_file_caches() -> None:
+    # Make shared loaders rescan the data directory and active marker (e.g. after an upload)
+    for loader in list(_shared_loaders):
+        loader.invalidate_file_cache()
+
 
 class ChargingDataRepository:
     def __init__(self):
@@ -18,7 +45,7 @@ class ChargingDataRepository:
         try:
             # Use "ALL" for aggregated data if station_id is None
             loader_id = station_id if station_id is not None else "ALL"
-            loader = ChargingDataLoader(loader_id)
+            loader = _get_loader(loader_id)
 
             df = loader.load_historical_sessions(days=days)
 
@@ -72,7 +99,7 @@ class ChargingDataRepository:
     def get_data_summary(self, station_id: str) -> Dict[str, Any]:
         
         try:
-            loader = ChargingDataLoader(station_id)
+            loader = _get_loader(station_id)
             summary = loader.get_data_summary()
 
             if not summary or "error" in summary:
@@ -87,7 +114,7 @@ class ChargingDataRepository:
     def analyze_charging_patterns(self, station_id: str) -> Dict[str, Any]:
         
         try:
-            loader = ChargingDataLoader(station_id)
+            loader = _get_loader(station_id)
             patterns = loader.analyze_charging_patterns()
 
             if not patterns or "error" in patterns:
@@ -102,7 +129,7 @@ class ChargingDataRepository:
     def get_realtime_status(self, station_id: str) -> Dict[str, Any]:
         
         try:
-            loader = ChargingDataLoader(station_id)
+            loader = _get_loader(station_id)
             status = loader.load_realtime_status()
             return status or {}
         except Exception as e:
@@ -113,7 +140,7 @@ class ChargingDataRepository:
         
         try:
             # Use a dummy loader to get external factors
-            loader = ChargingDataLoader("ALL")
+            loader = _get_loader("ALL")
             factors = loader.load_external_factors()
             return factors or {}
         except Exception as e:
@@ -142,76 +169,118 @@ class ChargingDataRepository:
         
         current_time = datetime.now()
 
-        # Temporarily disable cache for debugging location issue
-        # if (self._station_cache is not None and
-        #     self._cache_timestamp is not None and
-        #     (current_time - self._cache_timestamp).total_seconds() < self._cache_expire_minutes * 60):
-        #     return self._station_cache
+        if (self._station_cache is not None and
+            self._cache_timestamp is not None and
+            (current_time - self._cache_timestamp).total_seconds() < self._cache_expire_minutes * 60):
+            return self._station_cache
 
-        # Refresh cache
+        # Refresh cache (reuse the on-disk snapshot while the source CSV is unchanged)
         self.logger.info("Refreshing station cache...")
-        print("DEBUG: Starting to load stations from data...")
-        self._station_cache = self._load_stations_from_data()
+        loader = _get_loader("ALL")
+        cache_key = self._stations_cache_key(loader)
+        stations = self._read_persisted_stations(loader, cache_key)
+        if stations is None:
+            print("DEBUG: Starting to load stations from data...")
+            stations = self._load_stations_from_data()
+            if stations:
+                self._write_persisted_stations(loader, cache_key, stations)
+        self._station_cache = stations
         print(f"DEBUG: Loaded {len(self._station_cache)} stations")
         self._cache_timestamp = current_time
 
         return self._station_cache
 
+    def _stations_cache_key(self, loader: ChargingDataLoader) -> Optional[tuple]:
+        
+        try:
+            csv_file = loader.get_active_csv_file() or loader.get_latest_csv_file()
+            if csv_file is None:
+                return None
+            stat = (loader.data_dir / Path(csv_file).name).stat()
+            # Session counts cover the last 90 days, so the snapshot also expires daily
+            return (
+                STATIONS_CACHE_VERSION,
+                Path(csv_file).name,
+                stat.st_mtime_ns,
+                stat.st_size,
+                date.today().isoformat(),
+            )
+        except OSError:
+            return None
+
+    def _read_persisted_stations(
+        self, loader: ChargingDataLoader, cache_key: Optional[tuple]
+    ) -> Optional[Dict[str, ChargingStation]]:
+        
+        if cache_key is None:
+            return None
+        try:
+            with open(loader.data_dir / STATIONS_CACHE_FILE, "rb") as f:
+                payload = pickle.load(f)
+            if payload.get("key") != cache_key:
+                return None
+            self.logger.info("Loaded station cache from disk")
+            return payload["stations"]
+        except Exception:
+            return None
+
+    def _write_persisted_stations(
+        self, loader: ChargingDataLoader, cache_key: Optional[tuple], stations: Dict[str, ChargingStation]
+    ) -> None:
+        
+        if cache_key is None:
+            return
+        cache_file = loader.data_dir / STATIONS_CACHE_FILE
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, "wb") as f:
+                pickle.dump({"key": cache_key, "stations": stations}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            self.logger.warning(f"Failed to persist station cache: {e}")
+            tmp_file.unlink(missing_ok=True)
+
     def _load_stations_from_data(self) -> Dict[str, ChargingStation]:
         
         stations = {}
 
         try:
             # Load full dataset first to get complete station metadata (no date filtering)
-            loader = ChargingDataLoader("ALL")
-            # Load raw CSV data without any date filtering
-            full_df = loader.load_csv_file()
-            if not full_df.empty:
-                # Apply data type conversion and cleaning but not date filtering
-                full_df = loader._normalize_column_names(full_df)
-                full_df = loader._convert_data_types(full_df)
-                full_df = loader._clean_data(full_df)
+            loader = _get_loader("ALL")
+            # Normalized/cleaned data without date filtering (served from the Parquet cache when fresh)
+            full_df = loader.load_prepared_sessions()
 
             if full_df.empty or "충전소ID" not in full_df.columns:
                 self.logger.warning("No station data available")
                 return stations
 
-            # Create a mapping of station metadata from full dataset
-            station_metadata = {}
-            for station_id, station_group in full_df.groupby("충전소ID"):
-                # Get the first row which should contain all station metadata
-                first_row = station_group.iloc[0]
-                station_metadata[str(station_id)] = first_row
+            # One metadata row per station (first occurrence), ordered by station ID; rows without an ID are skipped
+            meta = (
+                full_df.dropna(subset=["충전소ID"])
+                .drop_duplicates("충전소ID", keep="first")
+                .sort_values("충전소ID", kind="stable")
+            )
 
             # Now load filtered data for session counts and activity
             df = loader.load_historical_sessions(days=90)
 
-            # Group by station and create ChargingStation objects using full metadata
-            for station_id in station_metadata.keys():
-                try:
-                    # Use full metadata for station creation
-                    metadata_row = station_metadata[station_id]
-                    metadata_df = full_df[full_df["충전소ID"] == station_id].head(1)  # Just need one row with metadata
-
-                    # Create station with full metadata
-                    station = ChargingStation.from_csv_data(str(station_id), metadata_df)
-
-                    # Update with current session counts from filtered data
-                    if station_id in df["충전소ID"].values:
-                        current_data = df[df["충전소ID"] == station_id]
-                        station.data_sessions = len(current_data)
-                        if not current_data.empty and "충전시작일시" in current_data.columns:
-                            last_session = current_data["충전시작일시"].max()
-                            station.last_activity = (
-                                last_session.strftime("%Y-%m-%d") if pd.notna(last_session) else None
-                            )
-                    else:
-                        station.data_sessions = 0
-                        station.last_activity = None
-
-                    stations[str(station_id)] = station
-                except Exception as e:
-                    self.logger.error(f"Failed to create station object for {station_id}: {e}")
+            # Session count / last activity per station in a single groupby pass
+            activity = {}
+            if not df.empty and "충전소ID" in df.columns:
+                if "충전시작일시" in df.columns:
+                    agg = df.groupby("충전소ID", observed=True, sort=False)["충전시작일시"].agg(["size", "max"])
+                    activity = {str(sid): (int(size), last) for sid, size, last in zip(agg.index, agg["size"], agg["max"])}
+                else:
+                    counts = df["충전소ID"].value_counts(sort=False)
+                    activity = {str(sid): (int(size), None) for sid, size in counts.items() if size > 0}
+
+            # Create ChargingStation objects using full metadata (independent per station)
+            has_start_time = "충전시작일시" in df.columns
+            for pos, station_id in enumerate(meta["충전소ID"].astype(str)):
+                # Just need one row with metadata
+                station = self._build_station(station_id, meta.iloc[[pos]], activity.get(station_id), has_start_time)
+                if station is not None:
+                    stations[station_id] = station
 
             # Add aggregated "ALL" station
             if stations:
@@ -260,10 +329,40 @@ class ChargingDataRepository:
 
         return stations
 
+    def _build_station(
+        self, station_id: str, metadata_df: pd.DataFrame, activity: Optional[tuple], has_start_time: bool
+    ) -> Optional[ChargingStation]:
+        
+        try:
+            # Create station with full metadata
+            station = ChargingStation.from_csv_data(station_id, metadata_df)
+
+            # Update with current session counts from filtered data
+            if activity is not None:
+                station.data_sessions, last_session = activity
+                if has_start_time:
+                    station.last_activity = (
+                        last_session.strftime("%Y-%m-%d") if pd.notna(last_session) else None
+                    )
+            else:
+                station.data_sessions = 0
+                station.last_activity = None
+
+            return station
+        except Exception as e:
+            self.logger.error(f"Failed to create station object for {station_id}: {e}")
+            return None
+
     def invalidate_cache(self) -> None:
         
         self._station_cache = None
         self._cache_timestamp = None
+        try:
+            (_get_loader("ALL").data_dir / STATIONS_CACHE_FILE).unlink(missing_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Failed to remove persisted station cache: {e}")
+        # Drop shared loaders so their file/scan caches pick up CSV changes
+        _get_loader.cache_clear()
         self.logger.info("Station cache invalidated")
 
     def get_station_sessions(self, station_id: str, limit: Optional[int] = None) -> List[ChargingSession]:
@@ -278,13 +377,11 @@ class ChargingDataRepository:
             if limit:
                 df = df.head(limit)
 
-            sessions = []
-            for _, row in df.iterrows():
-                try:
-                    session = ChargingSession.from_csv_row(row)
-                    sessions.append(session)
-                except Exception as e:
-                    self.logger.warning(f"Failed to create session object: {e}")
+            # Columnar construction; rows missing required fields are skipped
+            sessions = ChargingSession.from_dataframe(df)
+            skipped = len(df) - len(sessions)
+            if skipped:
+                self.logger.warning(f"Skipped {skipped} invalid session rows for station {station_id}")
 
             return sessions
 
@@ -1,4 +1,5 @@
 # 데이터 검증 모듈
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Any
 
@@ -25,20 +26,20 @@ class DataValidator:
         if "순간최고전력" not in df.columns:
             return False
 
-        power_data = df["순간최고전력"].dropna()
+        power_data = df["순간최고전력"].to_numpy(dtype=np.float64, na_value=np.nan)
+        finite = ~np.isnan(power_data)
+        total_power_count = np.count_nonzero(finite)
 
-        if power_data.empty:
+        if total_power_count == 0:
             return False
 
         # 물리적 한계 설정 (EV 충전기 기준)
         min_power = 0.1  # 0.1kW - 최소 충전 전력
         max_power = 350.0  # 350kW - 최고 급속충전기 한계
 
-        # 범위 내 데이터 비율 계산
-        valid_power_count = ((power_data >= min_power) & (power_data <= max_power)).sum()
-        total_power_count = len(power_data)
-
-        valid_ratio = valid_power_count / total_power_count if total_power_count > 0 else 0
+        # 범위 내 데이터 비율 계산 (NaN은 비교 결과가 False이므로 자동 제외)
+        valid_power_count = np.count_nonzero((power_data >= min_power) & (power_data <= max_power))
+        valid_ratio = valid_power_count / total_power_count
 
         # 90% 이상의 데이터가 유효한 범위에 있으면 통과
         return valid_ratio >= 0.9
@@ -52,27 +53,36 @@ class DataValidator:
             if col not in df.columns:
                 return False
 
-        # 날짜 형식 확인 및 변환
+        # 날짜 형식 확인 및 변환 (로더에서 이미 datetime으로 변환된 컬럼은 재파싱하지 않음)
         try:
-            start_times = pd.to_datetime(df["충전시작일시"], errors="coerce")
-            end_times = pd.to_datetime(df["충전종료일시"], errors="coerce")
+            start_times = self._as_datetime(df["충전시작일시"])
+            end_times = self._as_datetime(df["충전종료일시"])
         except Exception:
             return False
 
         # null이 아닌 데이터에 대해서만 검증
-        valid_mask = start_times.notna() & end_times.notna()
+        valid_mask = start_times.notna().to_numpy() & end_times.notna().to_numpy()
+        valid_count = np.count_nonzero(valid_mask)
 
-        if valid_mask.sum() == 0:  # 유효한 날짜 데이터가 없음
+        if valid_count == 0:  # 유효한 날짜 데이터가 없음
             return False
 
         # 시작시간 <= 종료시간 확인
-        valid_time_order = (start_times <= end_times)[valid_mask]
-        valid_ratio = valid_time_order.sum() / len(valid_time_order) if len(valid_time_order) > 0 else 0
+        valid_time_order = np.count_nonzero((start_times.to_numpy() <= end_times.to_numpy()) & valid_mask)
+        valid_ratio = valid_time_order / valid_count
 
         # 95% 이상의 데이터가 시간 순서를 만족하면 통과
         return valid_ratio >= 0.95
 
 
+    @staticmethod
+    def _as_datetime(series: pd.Series) -> pd.Series:
+        
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return series
+        return pd.to_datetime(series, errors="coerce")
+
+
 class ChargingDataValidator:
     
 
@@ -91,7 +101,8 @@ class ChargingDataValidator:
             validation_results["basic_info"] = {
                 "total_rows": len(df),
                 "total_columns": len(df.columns),
-                "memory_usage_mb": round(df.memory_usage(deep=True).sum() / 1024 / 1024, 2),
+                # 얕은 집계 (deep=True는 object 컬럼의 모든 문자열을 순회하므로 대용량에서 느림)
+                "memory_usage_mb": round(df.memory_usage(deep=False).sum() / 1024 / 1024, 2),
             }
 
             # 2. 컬럼 검증
@@ -133,8 +144,10 @@ class ChargingDataValidator:
             "순간최고전력",
         ]
 
-        found_columns = [col for col in expected_columns if col in df.columns]
-        missing_columns = [col for col in expected_columns if col not in df.columns]
+        # Index 선형 탐색 대신 집합으로 한 번에 판별 (예상 컬럼 순서는 유지)
+        column_set = set(df.columns)
+        found_columns = [col for col in expected_columns if col in column_set]
+        missing_columns = [col for col in expected_columns if col not in column_set]
 
         return {
             "total_columns": len(df.columns),
@@ -147,28 +160,31 @@ class ChargingDataValidator:
     def _validate_data_types(self, df: pd.DataFrame) -> Dict[str, Any]:
         
         data_types = {}
+        dtypes = df.dtypes
+        # 샘플 값은 앞부분에서 먼저 찾고, 결측이 많아 부족할 때만 전체 컬럼을 스캔
+        head = df.head(64)
         for col in df.columns:
-            dtype = str(df[col].dtype)
-            sample_values = df[col].dropna().head(3).tolist()
-            data_types[col] = {"dtype": dtype, "sample_values": sample_values}
+            sample = head[col].dropna()
+            if len(sample) < 3 and len(df) > len(head):
+                sample = df[col].dropna()
+            data_types[col] = {"dtype": str(dtypes[col]), "sample_values": sample.head(3).tolist()}
 
         return data_types
 
     def _validate_missing_values(self, df: pd.DataFrame) -> Dict[str, Any]:
         
-        missing_info = {}
         total_rows = len(df)
+        # 컬럼별 반복 대신 전체 결측 마스크를 한 번에 집계
+        missing_counts = df.isnull().sum()
+        missing_percentages = (missing_counts / total_rows * 100).round(2)
 
-        for col in df.columns:
-            missing_count = df[col].isnull().sum()
-            missing_percentage = (missing_count / total_rows) * 100
-
-            missing_info[col] = {
-                "missing_count": int(missing_count),
-                "missing_percentage": round(missing_percentage, 2),
+        return {
+            col: {
+                "missing_count": int(missing_counts[col]),
+                "missing_percentage": float(missing_percentages[col]),
             }
-
-        return missing_info
+            for col in df.columns
+        }
 
     def _validate_station_ids(self, df: pd.DataFrame) -> Dict[str, Any]:
         
@@ -195,7 +211,7 @@ class ChargingDataValidator:
     def _has_power_columns(self, df: pd.DataFrame) -> bool:
         
         power_columns = ["순간최고전력", "충전량", "전력"]
-        return any(col in df.columns for col in power_columns)
+        return not set(df.columns).isdisjoint(power_columns)
 
     def _get_overall_status(self, validation_results: Dict) -> Dict[str, Any]:
         
@@ -1,18 +1,44 @@
 from __future__ import annotations
 from contextlib import asynccontextmanager
-from datetime import datetime
+from pathlib import Path
 from typing import Any
 import sys
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from .core.clock import iso_now
 from .core.logger import setup_logger
 from .core.config import settings
 
 # ===== Global Variables =====
 logger: Any = None
 
+# Directories created at startup for batch processing
+DATA_DIRS = ("data/predictions", "data/uploads")
+
+# Production frontend origins (see .env.production), always allowed even if
+# ALLOWED_ORIGINS is overridden or the dev regex below is narrowed.
+PRODUCTION_ORIGINS = ("http://220.69.200.55:32376", "https://220.69.200.55:32376")
+
+# Local/dev origins on any port. Starlette compiles this once and fullmatches it
+# before the allow_origins lookup; the group is non-capturing to skip group bookkeeping.
+CORS_ORIGIN_REGEX = r"https?://(?:localhost|127\.0\.0\.1|220\.69\.200\.55):\d+"
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (int dict keys and numpy values allowed)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
 
 async def initialize_services():
     """Initialize application services."""
@@ -23,9 +49,8 @@ async def initialize_services():
         from .api.routes import set_main_module
 
         # 배치 처리를 위한 디렉토리 생성
-        import os
-        os.makedirs("data/predictions", exist_ok=True)
-        os.makedirs("data/uploads", exist_ok=True)
+        for data_dir in DATA_DIRS:
+            Path(data_dir).mkdir(parents=True, exist_ok=True)
         logger.info("Created data directories")
 
         set_main_module(sys.modules[__name__])
@@ -82,8 +107,8 @@ def setup_routes():
     
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.cors_origins,
-        allow_origin_regex=r"^https?://(localhost|127\.0\.0\.1|220\.69\.200\.55):\d+$",
+        allow_origins=list(dict.fromkeys([*settings.cors_origins, *PRODUCTION_ORIGINS])),
+        allow_origin_regex=CORS_ORIGIN_REGEX,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -102,7 +127,12 @@ def setup_routes():
 
 
 # ===== FastAPI App =====
-app = FastAPI(title="EV Charging Station Peak Predictor", version="1.0.0", lifespan=lifespan)
+app = FastAPI(
+    title="EV Charging Station Peak Predictor",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse,
+)
 
 # Initialize logger once
 logger = setup_logger("charging_predictor", level=settings.log_level)
@@ -123,14 +153,14 @@ async def log_cors(request: Request, call_next):
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return {"status": "healthy", "timestamp": iso_now()}
 
 
 @app.get("/")
 async def root():
     return {
         "message": "EV Charging Station Peak Predictor API",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": iso_now(),
         "docs": "/docs",
         "api": "/api",
     }
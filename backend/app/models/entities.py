@@ -1,8 +1,14 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+import logging
+import numpy as np
 import pandas as pd
 
+from ..core.clock import iso_now
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class ChargingSession:
@@ -90,15 +96,72 @@ class ChargingSession:
             )
 
         except Exception as e:
-            # Provide more context for debugging
-            row_info = (
-                f"Row data: {dict(row.head(5))}"
-                if hasattr(row, "head")
-                else f"Row: {row}"
-            )
-            raise ValueError(
-                f"Failed to create ChargingSession from CSV row: {e}. {row_info}"
+            # Original exception is chained for debugging; no eager row formatting
+            raise ValueError(f"Failed to create ChargingSession from CSV row: {e}") from e
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> List["ChargingSession"]:
+        # Same rules as from_csv_row applied column-wise; rows with invalid required fields are dropped
+        required_columns = ("충전소ID", "충전시작일시", "순간최고전력")
+        if df.empty or any(col not in df.columns for col in required_columns):
+            return []
+
+        def numeric(col):
+            if col not in df.columns:
+                return pd.Series(np.nan, index=df.index)
+            return pd.to_numeric(df[col], errors="coerce").astype(np.float64)
+
+        def soc(col):
+            # Truncate like int(); values outside 0-100 become None
+            values = np.trunc(numeric(col))
+            in_range = (values >= 0) & (values <= 100)
+            return [int(v) if ok else None for v, ok in zip(values.tolist(), in_range.tolist())]
+
+        start_times = df["충전시작일시"]
+        end_times = start_times
+        if "충전종료일시" in df.columns:
+            end_times = df["충전종료일시"].where(df["충전종료일시"].notna(), start_times)  # Use start time as fallback
+        peak_power = numeric("순간최고전력")
+
+        valid = (
+            df["충전소ID"].notna()
+            & start_times.notna()
+            & (peak_power > 0)
+            & (peak_power <= 1000)
+        ).to_numpy()
+
+        session_ids = df["세션ID"].tolist() if "세션ID" in df.columns else df.index.tolist()
+        charger_ids = df["충전기ID"].tolist() if "충전기ID" in df.columns else ["UNKNOWN"] * len(df)
+
+        columns = zip(
+            valid.tolist(),
+            session_ids,
+            df["충전소ID"].tolist(),
+            charger_ids,
+            start_times.tolist(),
+            end_times.tolist(),
+            peak_power.tolist(),
+            numeric("충전량(kWh)").fillna(0.0).tolist(),
+            soc("시작SOC(%)"),
+            soc("완료SOC(%)"),
+            numeric("충전시간").fillna(0.0).tolist(),
+        )
+        return [
+            cls(
+                session_id=str(session_id),
+                station_id=str(station_id),
+                charger_id=str(charger_id),
+                start_time=start_time,
+                end_time=end_time,
+                peak_power=peak,
+                total_energy=energy,
+                start_soc=start_soc,
+                end_soc=end_soc,
+                duration_minutes=duration,
             )
+            for ok, session_id, station_id, charger_id, start_time, end_time, peak, energy, start_soc, end_soc, duration in columns
+            if ok
+        ]
 
 
 @dataclass
@@ -126,12 +189,7 @@ class ChargingStation:
             # Safe string conversion with fallbacks
             def safe_str_get(key, default):
                 value = first_row.get(key)
-                result = str(value) if pd.notna(value) else default
-                if key == "충전소주소":
-                    print(
-                        f"DEBUG safe_str_get - Key: {key}, Value: '{value}', Result: '{result}'"
-                    )
-                return result
+                return str(value) if pd.notna(value) else default
 
             name = safe_str_get("충전소명", f"충전소 {station_id}")
             location = safe_str_get("충전소주소", "위치 정보 없음")
@@ -139,15 +197,16 @@ class ChargingStation:
             connector_type = safe_str_get("커넥터명", "DC콤보")
             operator = safe_str_get("운영사명", None)
 
-            # Debug: Print actual values
-            print(f"DEBUG - Station {station_id}:")
-            print(f"  충전소주소 value: '{first_row.get('충전소주소')}'")
-            print(f"  Location result: '{location}'")
+            # Debug: actual address values (formatted only when DEBUG is enabled)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Station %s: 충전소주소 value=%r, location=%r",
+                    station_id, first_row.get("충전소주소"), location,
+                )
 
             # Extract region and city safely
             address = first_row.get("충전소주소", "")
-            region = cls._extract_region(address)
-            city = cls._extract_city(address)
+            region, city = cls._split_address(address)
 
             # Count unique chargers safely
             num_chargers = None
@@ -175,30 +234,17 @@ class ChargingStation:
             )
 
     @staticmethod
-    def _extract_region(address: str) -> str:
-        try:
-            if not address or pd.isna(address):
-                return "미상"
-            address_str = str(address).strip()
-            if not address_str:
-                return "미상"
-            parts = address_str.split()
-            return parts[0] if parts else "미상"
-        except Exception:
-            return "미상"
-
-    @staticmethod
-    def _extract_city(address: str) -> str:
+    def _split_address(address: str) -> Tuple[str, str]:
+        # Region and city are the first two address tokens (one split for both)
         try:
             if not address or pd.isna(address):
-                return "미상"
-            address_str = str(address).strip()
-            if not address_str:
-                return "미상"
-            parts = address_str.split()
-            return parts[1] if len(parts) >= 2 else "미상"
+                return "미상", "미상"
+            parts = str(address).split(None, 2)
+            region = parts[0] if parts else "미상"
+            city = parts[1] if len(parts) >= 2 else "미상"
+            return region, city
         except Exception:
-            return "미상"
+            return "미상", "미상"
 
 
 @dataclass
@@ -252,7 +298,7 @@ class ContractRecommendation:
             "safety_margin": self.safety_margin,
             "method": self.method,
             "reasoning": self.reasoning,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_now(),
         }
 
 
@@ -59,16 +59,20 @@ class StationMetricsCalculator:
             if col in station_data.columns:
                 power_data = station_data[col].dropna()
                 if not power_data.empty:
+                    # 백분위수는 한 번의 np.quantile 호출로 계산 (컬럼을 반복 정렬하지 않음)
+                    p50, p75, p90, p95, p99 = np.quantile(
+                        power_data.to_numpy(dtype=np.float64), [0.50, 0.75, 0.90, 0.95, 0.99]
+                    )
                     return {
                         "avg_power": round(power_data.mean(), 1),
                         "max_power": round(power_data.max(), 1),
                         "min_power": round(power_data.min(), 1),
                         "power_std": round(power_data.std(), 1),
-                        "percentile_50": round(power_data.quantile(0.50), 1),
-                        "percentile_75": round(power_data.quantile(0.75), 1),
-                        "percentile_90": round(power_data.quantile(0.90), 1),
-                        "percentile_95": round(power_data.quantile(0.95), 1),
-                        "percentile_99": round(power_data.quantile(0.99), 1),
+                        "percentile_50": round(p50, 1),
+                        "percentile_75": round(p75, 1),
+                        "percentile_90": round(p90, 1),
+                        "percentile_95": round(p95, 1),
+                        "percentile_99": round(p99, 1),
                     }
 
         return {}
@@ -122,7 +122,8 @@ class StationService:
 
         # 데이터량이 많은 경우 세션 수 기준으로 정렬하여 처리 (상한선 제거)
         if len(unique_stations) > 50:
-            station_counts = df[station_col].value_counts()
+            # category 컬럼이면 관측되지 않은 카테고리(0건) 제외
+            station_counts = df[station_col].value_counts()[lambda counts: counts > 0]
             unique_stations = station_counts.index.tolist()  # 모든 충전소 포함
 
         for station_id in unique_stations:
@@ -349,7 +350,10 @@ class StationService:
     def _get_station_name_by_id(self, station_id: str) -> str:
         try:
             loader = ChargingDataLoader(station_id)
-            df = loader.load_csv_file()
+            # ID/이름 컬럼만 파싱
+            df = loader.load_csv_file(
+                usecols=["충전소ID", "station_id", "충전소명", "STATION_ID", "station_name", "name"]
+            )
             if df.empty:
                 return station_id
 
@@ -0,0 +1,23 @@
+"""
+캐시된 현재 시각(iso_now) 테스트
+"""
+
+from datetime import datetime
+
+from app.core import clock
+
+
+def test_iso_now_refreshes_after_backward_clock_step(monkeypatch):
+    """시계가 뒤로 조정되어도 캐시된 시각을 계속 반환하지 않음"""
+    now = [1_800_000_000.2]
+    monkeypatch.setattr(clock.time, "time", lambda: now[0])
+    monkeypatch.setattr(clock, "_now_cache", (None, ""))
+
+    first = clock.iso_now()
+    assert first == datetime.fromtimestamp(1_800_000_000).isoformat()
+
+    now[0] += 0.5
+    assert clock.iso_now() == first
+
+    now[0] -= 3600
+    assert clock.iso_now() == datetime.fromtimestamp(1_800_000_000 - 3600).isoformat()
@@ -0,0 +1,176 @@
+"""
+충전 데이터 로더(ChargingDataLoader) 테스트
+
+Parquet 사이드카 캐시와 파일 탐색 캐시 검증
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.data import loader as loader_module
+from app.data.loader import ChargingDataLoader
+
+CSV_HEADER = "충전소ID,충전소명,충전기ID,충전시작일시,충전종료일시,순간최고전력,충전량(kWh)\n"
+CSV_ROWS = (
+    "BNS0001,서울 강남,C1,2026-01-01 09:00:00,2026-01-01 09:40:00,50.2,41.09\n"
+    "BNS0002,부산 해운대,C2,2026-01-02 10:00:00,2026-01-02 10:30:00,80.1,30.50\n"
+)
+EXTRA_ROW = "BNS0003,대전,C3,2026-01-03 11:00:00,2026-01-03 11:20:00,40.0,12.00\n"
+
+requires_pyarrow = pytest.mark.skipif(not loader_module.PYARROW_AVAILABLE, reason="pyarrow 미설치")
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "충전이력_test.csv"
+    path.write_text(CSV_HEADER + CSV_ROWS, encoding="utf-8")
+    return path
+
+
+@requires_pyarrow
+def test_sidecar_not_keyed_on_csv_rewritten_during_load(csv_file, monkeypatch):
+    """처리 도중 CSV가 교체되면 이전 데이터가 새 파일의 캐시로 저장되지 않음"""
+    loader = ChargingDataLoader("ALL", str(csv_file.parent))
+    prepare = loader._prepare_sessions
+
+    def prepare_then_rewrite(df):
+        csv_file.write_text(CSV_HEADER + CSV_ROWS + EXTRA_ROW, encoding="utf-8")
+        return prepare(df)
+
+    monkeypatch.setattr(loader, "_prepare_sessions", prepare_then_rewrite)
+    assert len(loader.load_prepared_sessions()) == 2
+
+    monkeypatch.setattr(loader, "_prepare_sessions", prepare)
+    assert len(loader.load_prepared_sessions()) == 3
+
+
+@requires_pyarrow
+def test_sidecar_write_leaves_no_temp_files(csv_file):
+    """사이드카는 임시 파일을 거쳐 완성된 파일로만 남음"""
+    loader = ChargingDataLoader("ALL", str(csv_file.parent))
+    loader.load_prepared_sessions()
+
+    sidecar, meta_file = loader._sidecar_paths(csv_file)
+    assert sidecar.exists()
+    assert json.loads(meta_file.read_text(encoding="utf-8"))["size"] == csv_file.stat().st_size
+    assert not list(csv_file.parent.glob("*.tmp"))
+
+
+@requires_pyarrow
+def test_sidecar_invalidated_on_size_change(csv_file):
+    """CSV 크기가 바뀌면 사이드카를 버리고 다시 읽음"""
+    loader = ChargingDataLoader("ALL", str(csv_file.parent))
+    assert len(loader.load_prepared_sessions()) == 2
+    assert loader._read_parquet_sidecar(csv_file) is not None
+
+    csv_file.write_text(CSV_HEADER + CSV_ROWS + EXTRA_ROW, encoding="utf-8")
+    assert loader._read_parquet_sidecar(csv_file) is None
+    assert len(loader.load_prepared_sessions()) == 3
+
+
+@requires_pyarrow
+def test_sidecar_invalidated_on_mtime_change(csv_file):
+    """크기가 같아도 수정 시각이 바뀌면 사이드카를 버리고 다시 읽음"""
+    loader = ChargingDataLoader("ALL", str(csv_file.parent))
+    assert loader.load_prepared_sessions()["충전량(kWh)"].iloc[0] == pytest.approx(41.09)
+
+    stat = csv_file.stat()
+    csv_file.write_text(CSV_HEADER + CSV_ROWS.replace("41.09", "41.19"), encoding="utf-8")
+    os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert csv_file.stat().st_size == stat.st_size
+
+    assert loader._read_parquet_sidecar(csv_file) is None
+    assert loader.load_prepared_sessions()["충전량(kWh)"].iloc[0] == pytest.approx(41.19)
+
+
+def test_file_scan_cache_invalidation(csv_file):
+    """파일 탐색 캐시는 TTL 동안 유지되고 invalidate_file_cache로 즉시 갱신"""
+    loader = ChargingDataLoader("ALL", str(csv_file.parent))
+    assert len(loader.find_csv_files()) == 1
+
+    (csv_file.parent / "충전이력_new.csv").write_text(CSV_HEADER + CSV_ROWS, encoding="utf-8")
+    assert len(loader.find_csv_files()) == 1
+
+    loader.invalidate_file_cache()
+    assert len(loader.find_csv_files()) == 2
+
+
+def test_filter_by_station_categorical_matches_object_path(tmp_path):
+    """category 컬럼 필터링 결과가 문자열 컬럼과 동일 (앞뒤 공백, 결측 포함)"""
+    ids = [" BNS0001", "BNS0002", "BNS0001 ", None, "BNS0001", "bns0001", "BNS00012"]
+    df = pd.DataFrame({"충전소ID": ids, "순간최고전력": np.arange(len(ids), dtype=float)})
+    loader = ChargingDataLoader("BNS0001", str(tmp_path))
+
+    expected = loader._filter_by_station(df)
+    categorical = df.assign(충전소ID=df["충전소ID"].astype("category"))
+    result = loader._filter_by_station(categorical)
+
+    assert list(result.index) == [0, 2, 4]
+    assert list(result.index) == list(expected.index)
+    assert isinstance(result["충전소ID"].dtype, pd.CategoricalDtype)
+
+
+def test_convert_data_types_detects_date_format(tmp_path):
+    """첫 번째가 아닌 날짜 형식도 샘플로 판별하여 전체 컬럼에 적용"""
+    loader = ChargingDataLoader("ALL", str(tmp_path))
+    df = pd.DataFrame({"충전시작일시": ["2026/01/02 09:00:00", None, "2026/01/03 10:30:00"]})
+
+    result = loader._convert_data_types(df)
+
+    assert loader._date_formats["충전시작일시"] == "%Y/%m/%d %H:%M:%S"
+    assert result["충전시작일시"].iloc[0] == pd.Timestamp("2026-01-02 09:00:00")
+    assert pd.isna(result["충전시작일시"].iloc[1])
+    assert result["충전시작일시"].iloc[2] == pd.Timestamp("2026-01-03 10:30:00")
+
+
+@requires_pyarrow
+def test_arrow_read_falls_back_to_pandas_on_ragged_rows(tmp_path, monkeypatch):
+    """Arrow가 거부하는 행(필드 부족)이 있어도 pandas로 다시 읽어 모든 행을 유지"""
+    monkeypatch.setattr(loader_module, "ARROW_READ_MB", -1)
+    csv_file = tmp_path / "충전이력_ragged.csv"
+    csv_file.write_text(CSV_HEADER + CSV_ROWS + "BNS0003,대전,C3,2026-01-03 11:00:00\n", encoding="utf-8")
+    loader = ChargingDataLoader("ALL", str(tmp_path))
+
+    df = loader.load_csv_file(csv_file)
+
+    assert len(df) == 3
+    assert df["충전소ID"].tolist() == ["BNS0001", "BNS0002", "BNS0003"]
+    assert df["순간최고전력"].tolist()[:2] == [50.2, 80.1]
+    assert pd.isna(df["순간최고전력"].iloc[2])
+
+
+@requires_pyarrow
+def test_remove_sidecars_with_csv(csv_file):
+    """CSV 삭제 시 사이드카도 삭제하고, 원본이 없는 사이드카는 정리"""
+    loader = ChargingDataLoader("ALL", str(csv_file.parent))
+    loader.load_prepared_sessions()
+    sidecar, meta_file = loader._sidecar_paths(csv_file)
+    assert sidecar.exists() and meta_file.exists()
+
+    loader_module.remove_parquet_sidecars(csv_file)
+    assert not sidecar.exists() and not meta_file.exists()
+
+    loader.load_prepared_sessions()
+    csv_file.unlink()
+    assert loader_module.remove_orphan_sidecars(csv_file.parent) == 2
+    assert not list(csv_file.parent.iterdir())
+
+
+def test_only_station_and_charger_ids_become_categorical(tmp_path):
+    """충전소/충전기 ID만 category로 변환하고 세션ID 같은 고유 ID는 문자열 유지"""
+    loader = ChargingDataLoader("ALL", str(tmp_path))
+    df = pd.DataFrame({
+        "충전소ID": ["BNS0001", "BNS0002", "BNS0001"],
+        "충전기ID": ["C1", "C2", "C1"],
+        "세션ID": ["S1", "S2", "S3"],
+    })
+
+    result = loader._convert_data_types(df)
+
+    assert isinstance(result["충전소ID"].dtype, pd.CategoricalDtype)
+    assert isinstance(result["충전기ID"].dtype, pd.CategoricalDtype)
+    assert result["세션ID"].dtype == object
@@ -0,0 +1,87 @@
+"""
+충전소 저장소(ChargingDataRepository) 테스트
+
+충전소 목록 구성과 캐시 동작 검증
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from app.data import repository
+from app.data.loader import ChargingDataLoader
+
+CSV_HEADER = "충전소ID,충전소명,충전기ID,충전시작일시,충전종료일시,순간최고전력,충전량(kWh)\n"
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """임시 데이터 디렉터리를 사용하는 저장소"""
+    csv_file = tmp_path / "충전이력_test.csv"
+    csv_file.write_text(
+        CSV_HEADER
+        + "BNS0001,서울 강남,C1,2026-01-01 09:00:00,2026-01-01 09:40:00,50.2,41.09\n"
+        + "BNS0002,부산 해운대,C2,2026-01-02 10:00:00,2026-01-02 10:30:00,80.1,30.50\n"
+        + ",대전,C3,2026-01-03 11:00:00,2026-01-03 11:20:00,40.0,12.00\n"
+        + "BNS0001,서울 강남,C1,2026-01-04 12:00:00,2026-01-04 12:50:00,60.3,44.10\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(repository, "_get_loader", lambda station_id: ChargingDataLoader(station_id, str(tmp_path)))
+    return repository.ChargingDataRepository()
+
+
+def test_station_count_skips_missing_ids(repo):
+    """충전소ID가 비어 있는 행은 충전소로 집계하지 않음"""
+    stations = repo._load_stations_from_data()
+
+    assert "nan" not in stations
+    assert sorted(stations) == ["ALL", "BNS0001", "BNS0002"]
+    assert stations["ALL"].location == "전국 (2개 충전소)"
+
+
+def test_invalidate_loader_file_caches_picks_up_new_csv(tmp_path, monkeypatch):
+    """업로드 후 무효화하면 공유 로더가 TTL 대기 없이 새 CSV를 사용"""
+    monkeypatch.setattr(
+        repository, "ChargingDataLoader", lambda station_id: ChargingDataLoader(station_id, str(tmp_path))
+    )
+    repository._get_loader.cache_clear()
+    try:
+        (tmp_path / "충전이력_old.csv").write_text(CSV_HEADER, encoding="utf-8")
+        loader = repository._get_loader("ALL")
+        assert [p.name for p in loader.find_csv_files()] == ["충전이력_old.csv"]
+
+        (tmp_path / "충전이력_new.csv").write_text(CSV_HEADER, encoding="utf-8")
+        (tmp_path / ".active_csv").write_text("충전이력_new.csv", encoding="utf-8")
+        repository.invalidate_loader_file_caches()
+
+        assert len(loader.find_csv_files()) == 2
+        assert loader.get_active_csv_file().name == "충전이력_new.csv"
+    finally:
+        repository._get_loader.cache_clear()
+
+
+def test_persisted_station_cache_invalidated_on_csv_change(repo, tmp_path):
+    """CSV가 바뀌면 디스크의 충전소 목록 캐시를 사용하지 않음"""
+    assert "BNS0003" not in repo._get_stations_cache()
+    assert (tmp_path / repository.STATIONS_CACHE_FILE).exists()
+
+    csv_file = tmp_path / "충전이력_test.csv"
+    with open(csv_file, "a", encoding="utf-8") as f:
+        f.write("BNS0003,광주,C4,2026-01-05 13:00:00,2026-01-05 13:30:00,70.0,25.00\n")
+
+    assert "BNS0003" in repository.ChargingDataRepository()._get_stations_cache()
+
+
+def test_station_cache_served_from_memory_while_fresh(repo):
+    """메모리 캐시가 유효한 동안에는 디스크 캐시를 다시 읽지 않음"""
+    reads = []
+    read_persisted = repo._read_persisted_stations
+    repo._read_persisted_stations = lambda *args: reads.append(1) or read_persisted(*args)
+
+    stations = repo._get_stations_cache()
+    assert repo._get_stations_cache() is stations
+    assert len(reads) == 1
+
+    repo._cache_timestamp -= timedelta(minutes=repo._cache_expire_minutes)
+    assert repo._get_stations_cache() == stations
+    assert len(reads) == 2
@@ -0,0 +1,95 @@
+"""
+엔티티(ChargingSession) 생성 테스트
+
+컬럼 단위 생성(from_dataframe)이 행 단위 생성(from_csv_row)과 같은 결과를 내는지 검증
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.models.entities import ChargingSession
+
+
+def _sessions_by_row(df: pd.DataFrame) -> list:
+    sessions = []
+    for _, row in df.iterrows():
+        try:
+            sessions.append(ChargingSession.from_csv_row(row))
+        except ValueError:
+            continue
+    return sessions
+
+
+def _as_tuples(sessions: list) -> list:
+    # NaT != NaT 이므로 비교용으로 치환
+    return [
+        tuple((key, "NaT" if value is pd.NaT else (type(value), value)) for key, value in vars(session).items())
+        for session in sessions
+    ]
+
+
+def _random_frame(rng: np.random.Generator, n: int, case: int) -> pd.DataFrame:
+    start = pd.Series(pd.date_range("2026-01-01", periods=n, freq="h"))
+    start[rng.random(n) < 0.15] = pd.NaT
+    # 잘못된 날짜 문자열은 로더의 형식 지정 파싱에서 NaT가 됨
+    end = pd.to_datetime(
+        pd.Series(rng.choice(["2026-01-01 10:00:00", "2026-13-45 99:00:00", "", None], n)),
+        format="%Y-%m-%d %H:%M:%S",
+        errors="coerce",
+    )
+    data = {
+        "충전소ID": rng.choice(["BNS0001", "BNS0002", "", None], n),
+        "충전시작일시": start.to_numpy(),
+        "충전종료일시": end.to_numpy(),
+        "순간최고전력": rng.choice([np.nan, -1.0, 0.0, 0.5, 50.0, 999.9, 1000.0, 1000.1], n),
+        "충전량(kWh)": rng.choice([np.nan, 0.0, 1.5, 42.25], n),
+        "시작SOC(%)": rng.choice([np.nan, -1.0, -0.5, 0.0, 45.7, 100.0, 100.5, 101.0], n),
+        "완료SOC(%)": rng.choice([np.nan, 20.0, 99.9, 150.0], n),
+        "충전시간": rng.choice([np.nan, 0.0, 35.0], n),
+    }
+    if case % 2:
+        data["충전기ID"] = rng.choice(["C1", "", None], n)
+    if case % 3 == 0:
+        data["세션ID"] = rng.choice(["S1", "", None], n)
+    df = pd.DataFrame(data, index=rng.permutation(n) + 100)
+    if case % 4 == 0:
+        df["충전소ID"] = df["충전소ID"].astype("category")
+    if case % 5 == 0:
+        # 문자열로 남은 전력 값 (빈 문자열, 숫자가 아닌 값 포함)
+        df["순간최고전력"] = df["순간최고전력"].astype(object).where(rng.random(n) > 0.3, rng.choice(["", "abc"], n))
+    return df
+
+
+@pytest.mark.parametrize("case", range(40))
+def test_from_dataframe_matches_from_csv_row(case):
+    """같은 프레임에서 행 단위/컬럼 단위로 만든 세션이 동일"""
+    rng = np.random.default_rng(case)
+    df = _random_frame(rng, int(rng.integers(1, 25)), case)
+
+    expected = _sessions_by_row(df)
+    result = ChargingSession.from_dataframe(df)
+
+    assert _as_tuples(result) == _as_tuples(expected)
+
+
+def test_from_dataframe_skips_invalid_rows():
+    """필수 값이 없거나 전력 범위를 벗어난 행만 제외"""
+    df = pd.DataFrame({
+        "충전소ID": ["BNS0001", None, "", "BNS0002", "BNS0003"],
+        "충전시작일시": pd.to_datetime(
+            ["2026-01-01 09:00:00", "2026-01-01 10:00:00", "2026-01-01 11:00:00", "bad", "2026-01-01 13:00:00"],
+            format="%Y-%m-%d %H:%M:%S",
+            errors="coerce",
+        ),
+        "순간최고전력": [50.0, 60.0, 70.0, 80.0, 1000.5],
+        "시작SOC(%)": [45.7, np.nan, 101.0, 10.0, 10.0],
+    })
+
+    sessions = ChargingSession.from_dataframe(df)
+
+    assert [(s.station_id, s.start_soc, s.end_time) for s in sessions] == [
+        ("BNS0001", 45, pd.Timestamp("2026-01-01 09:00:00")),
+        ("", None, pd.Timestamp("2026-01-01 11:00:00")),
+    ]
+    assert _as_tuples(sessions) == _as_tuples(_sessions_by_row(df))
@@ -0,0 +1,59 @@
+"""
+예측 성능 로그 버퍼링(PerformanceLogger) 테스트
+"""
+
+import gc
+import logging
+import threading
+import time
+import weakref
+from datetime import datetime
+
+import pytest
+
+from app.core.logger import PerformanceLogger
+
+
+@pytest.fixture
+def perf_logger(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    perf = PerformanceLogger("performance_test")
+    yield perf
+    perf.flush()
+
+
+def test_single_record_flushed_within_interval(perf_logger):
+    """레코드 하나만 들어와도 FLUSH_INTERVAL 안에 기록됨"""
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    perf_logger.logger.addHandler(handler)
+
+    perf_logger.log_prediction_performance(100.0, 90.0, "BNS0001", datetime(2026, 1, 1))
+    assert not records
+
+    deadline = time.monotonic() + PerformanceLogger.FLUSH_INTERVAL * 3
+    while not records and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert len(records) == 1
+    assert "Station: BNS0001" in records[0].getMessage()
+
+
+def test_instances_share_one_flush_thread_and_are_collectable(perf_logger):
+    """인스턴스마다 스레드를 만들지 않고, 수거된 인스턴스의 남은 로그도 기록됨"""
+    before = threading.active_count()
+    extra = PerformanceLogger("performance_test_extra")
+    assert threading.active_count() == before
+
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    extra.logger.addHandler(handler)
+    extra.log_prediction_performance(50.0, 45.0, "BNS0002", datetime(2026, 1, 1))
+
+    ref = weakref.ref(extra)
+    del extra
+    gc.collect()
+    assert ref() is None
+    assert [r.getMessage().split(",")[0] for r in records] == ["Prediction - Station: BNS0002"]
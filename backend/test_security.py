@@ -0,0 +1,60 @@
+"""
+API 키 인증과 잘못된 키 로그 제한(_log_invalid_key_attempt) 테스트
+"""
+
+import asyncio
+import logging
+import secrets
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.core import security
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(security, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    monkeypatch.setattr(
+        security,
+        "_invalid_key_state",
+        {"tokens": float(security._INVALID_KEY_MAX_WARNINGS), "refilled_at": 0.0, "suppressed": 0, "next_flush": 0.0},
+    )
+    monkeypatch.setattr(security, "_invalid_key_last_logged", {})
+    return now
+
+
+def test_random_key_flood_is_capped(clock, caplog):
+    """매번 다른 키로 시도해도 경고 수와 접두사 테이블 크기가 제한됨"""
+    attempts = 5000
+    with caplog.at_level(logging.WARNING, logger=security.__name__):
+        for _ in range(attempts):
+            security._log_invalid_key_attempt(secrets.token_hex(16))
+            clock[0] += 0.001
+
+    warnings = [r for r in caplog.records if r.getMessage().startswith("Invalid API key attempt")]
+    assert len(warnings) <= security._INVALID_KEY_MAX_WARNINGS + 1
+    assert len(security._invalid_key_last_logged) <= security._INVALID_KEY_MAX_PREFIXES
+
+    caplog.clear()
+    clock[0] += security._INVALID_KEY_FLUSH_INTERVAL
+    with caplog.at_level(logging.WARNING, logger=security.__name__):
+        security._log_invalid_key_attempt("pdp_bad_key")
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert messages[0] == f"Suppressed {attempts - len(warnings)} invalid API key attempts"
+    assert messages[1] == "Invalid API key attempt: pdp_bad_ke..."
+
+
+def test_api_key_role_lookup():
+    """설정된 키는 역할로 인증되고, 잘못된 키는 401"""
+    auth = security.APIKeyAuth()
+
+    user = asyncio.run(auth.get_current_user(credentials=None, x_api_key=security.API_KEYS["read"]))
+    assert user["role"] == "read"
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(auth.get_current_user(credentials=None, x_api_key=security.API_KEYS["read"][:-1] + "0"))
+    assert exc_info.value.status_code == 401
@@ -0,0 +1,33 @@
+"""
+충전소 목록 서비스(StationService) 테스트
+"""
+
+import numpy as np
+import pandas as pd
+
+from app.services.station_service import StationService
+
+
+def test_station_list_skips_unobserved_categories(monkeypatch):
+    """category 컬럼의 관측되지 않은 충전소는 마스크 비교 없이 건너뜀"""
+    observed = [f"BNS{i:04d}" for i in range(60)]
+    categories = observed + [f"OLD{i:04d}" for i in range(40)]
+    df = pd.DataFrame({
+        "충전소ID": pd.Categorical(observed * 2, categories=categories),
+        "충전소명": [f"충전소 {sid}" for sid in observed * 2],
+        "순간최고전력": np.linspace(10.0, 90.0, len(observed) * 2),
+    })
+
+    compared = []
+    series_eq = pd.Series.__eq__
+
+    def recording_eq(series, other):
+        if series.name == "충전소ID" and isinstance(other, str):
+            compared.append(other)
+        return series_eq(series, other)
+
+    monkeypatch.setattr(pd.Series, "__eq__", recording_eq)
+    stations = StationService()._process_station_list(df)
+
+    assert sorted(station["id"] for station in stations) == observed
+    assert sorted(compared) == observed